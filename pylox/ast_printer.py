@@ -3,40 +3,74 @@ Helper class to print the ast.
 
 Also simple application of the visitor pattern.
 """
+import io
 from .expr import Expr, Binary, Unary, Grouping, Literal, Ternery, Call
 
 class AstPrinter(Expr.Visitor):
+    def __init__(self):
+        # same type-keyed dispatch as the interpreter uses, saving the
+        # accept indirection per node
+        self._dispatch = {
+                Binary: self.visit_binary_expr,
+                Unary: self.visit_unary_expr,
+                Grouping: self.visit_grouping_expr,
+                Literal: self.visit_literal_expr,
+                Ternery: self.visit_ternery_expr,
+                Call: self.visit_call_expr,
+                }
+
     def print(self, expr: Expr):
-        print(expr.accept(self))
+        # the visitors write into one shared buffer instead of joining
+        # a fresh string list per node; shared sub-trees are still
+        # memoized by node identity for the duration of one print
+        self._cache: dict[int, str] = {}
+        self._buf = io.StringIO()
+        self.__visit(expr)
+        print(self._buf.getvalue())
+
+    def __visit(self, expr: Expr):
+        cached = self._cache.get(id(expr))
+        if cached is not None:
+            self._buf.write(cached)
+            return
+        start = self._buf.tell()
+        handler = self._dispatch.get(type(expr))
+        if handler is not None:
+            handler(expr)
+        else:
+            expr.accept(self)
+        self._cache[id(expr)] = self._buf.getvalue()[start:]
 
     def __parenthesize(self, name: str, exprs: list[Expr]):
-        parts = ["(", name]
+        buf = self._buf
+        buf.write("( ")
+        buf.write(name)
         for expr in exprs:
-            parts.append(expr.accept(self))
-        parts.append(")")
-        return " ".join(parts)
+            buf.write(" ")
+            self.__visit(expr)
+        buf.write(" )")
 
     def visit_binary_expr(self, expr: Binary):
-        return self.__parenthesize(
+        self.__parenthesize(
                 str(expr.operator.lexeme),
                 [expr.left, expr.right])
 
     def visit_unary_expr(self, expr: Unary):
-        return self.__parenthesize(str(expr.operator.lexeme), [expr.right])
+        self.__parenthesize(str(expr.operator.lexeme), [expr.right])
 
     def visit_grouping_expr(self, expr: Grouping):
-        return self.__parenthesize("group", [expr.expression])
+        self.__parenthesize("group", [expr.expression])
 
     def visit_literal_expr(self, expr: Literal):
-        return "nil" if expr.value is None else str(expr.value)
+        self._buf.write("nil" if expr.value is None else str(expr.value))
 
     def visit_ternery_expr(self, expr: Ternery):
-        return self.__parenthesize("?:",
-                                   [
-                                       expr.condition,
-                                       expr.then_expr,
-                                       expr.else_expr
-                                    ])
+        self.__parenthesize("?:",
+                            [
+                                expr.condition,
+                                expr.then_expr,
+                                expr.else_expr
+                             ])
 
     def visit_call_expr(self, expr: Call):
-        return "FUNCTION CALL"
+        self._buf.write("FUNCTION CALL")
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 from time import time_ns
 import math
+import os
 from . import callable
 from . import loxclass
 from . import lexer
@@ -17,8 +18,10 @@ if TYPE_CHECKING:
 
 
 class LoxTime(callable.LoxCallable):
-    def call(self, _: Interpreter, arguments: list[Any]):
-        return time_ns()*1E-6
+    # default arguments turn the global lookups into local loads
+    def call(self, _: Interpreter, arguments: list[Any],
+             _time_ns=time_ns, _scale=1E-6):
+        return _time_ns()*_scale
 
     def arity(self):
         return 0
@@ -38,9 +41,23 @@ class LoxInput(callable.LoxCallable):
         return "<native-fun: input>"
 
 
+# exact runtime type -> Lox type name; covers every type a Lox value
+# can actually have, so the isinstance ladder only runs on a miss
+_TYPE_TABLE = {
+        str: "string",
+        float: "number",
+        callable.LoxFunction: "fun",
+        loxclass.LoxClass: "class",
+        loxclass.LoxInstance: "instance",
+        }
+
+
 class LoxType(callable.LoxCallable):
     def call(self, _: Interpreter, arguments: list[Any]):
         arg = arguments[0]
+        name = _TYPE_TABLE.get(type(arg))
+        if name is not None:
+            return name
         if isinstance(arg, str):
             return "string"
         if isinstance(arg, float):
@@ -68,15 +85,7 @@ class LoxIsinstance(callable.LoxCallable):
                 or not isinstance(cls, loxclass.LoxClass):
             return False
 
-        return self.is_sub_class(inst.klass, cls)
-
-    def is_sub_class(self, sub: loxclass.LoxClass, supi: loxclass.LoxClass):
-        if sub == supi:
-            return True
-        for supersub in sub.superclasses:
-            if self.is_sub_class(supersub, supi):
-                return True
-        return False
+        return cls in inst.klass.ancestor_set
 
     def arity(self):
         return 2
@@ -108,13 +117,22 @@ class LoxHasprop(callable.LoxCallable):
         return "<native-fun: hasprop>"
 
 
+# precision -> format spec, so repeated tostring calls with the same
+# precision don't rebuild the spec string
+_FMT_CACHE: dict[int, str] = {}
+
+
 class LoxTostring(callable.LoxCallable):
     def call(self, _: Interpreter, arguments: list[Any]):
         if not isinstance(arguments[0], float) \
                 or not isinstance(arguments[1], float):
             return str(arguments[0])
 
-        return f"{arguments[0]:.{int(arguments[1])}f}"
+        precision = int(arguments[1])
+        spec = _FMT_CACHE.get(precision)
+        if spec is None:
+            spec = _FMT_CACHE.setdefault(precision, f".{precision}f")
+        return format(arguments[0], spec)
 
     def arity(self):
         return 2
@@ -195,10 +213,11 @@ class LoxRound(callable.LoxCallable):
 
 
 class LoxFloor(callable.LoxCallable):
-    def call(self, _: Interpreter, arguments: list[Any]):
-        if not isinstance(arguments[0], float): 
+    def call(self, _: Interpreter, arguments: list[Any],
+             _floor=math.floor, _float=float):
+        if not isinstance(arguments[0], float):
             return None
-        return float(math.floor(arguments[0]))
+        return _float(_floor(arguments[0]))
 
     def arity(self):
         return 1
@@ -209,6 +228,12 @@ class LoxFloor(callable.LoxCallable):
 
 
 class LoxInclude(callable.LoxCallable):
+    # already lexed, parsed and resolved include files live in the
+    # interpreter's _include_cache, so repeated includes only pay for
+    # the interpretation; the cache sits on the Interpreter because
+    # the cached nodes carry interpreter-specific state (resolver
+    # output, global-slot caches) and a module-level dict keyed by
+    # id(interpreter) could hand a recycled id another's AST
     def call(self, intpr: Interpreter, arguments: list[Any]):
         filename = arguments[0]
         dummy_token = lexer.Token(
@@ -216,11 +241,27 @@ class LoxInclude(callable.LoxCallable):
                 "include",
                 lexer.SourcePosition())
         try:
+            stat = os.stat(filename)
             file = open(filename)
         except FileNotFoundError:
             raise LoxRuntimeError(
                    dummy_token,
                    "File '" + filename + "' not found.")
+
+        key = (os.path.abspath(filename),
+               stat.st_mtime_ns, stat.st_size)
+        cached = intpr._include_cache.get(key)
+        if cached is not None:
+            file.close()
+            # the cached nodes still carry the resolver output from
+            # the first include, so nothing has to be re-resolved
+            source, statements = cached
+            orig_source = intpr.error_reporter.source
+            intpr.error_reporter.update_source(source)
+            intpr.interpret(statements)
+            intpr.error_reporter.update_source(orig_source)
+            return
+
         with file:
             source = file.read()
             orig_source = intpr.error_reporter.source
@@ -241,6 +282,8 @@ class LoxInclude(callable.LoxCallable):
                         dummy_token,
                         "Errors found in included file '" + filename + "'.")
 
+            intpr._include_cache[key] = (source, statements)
+
             intpr.interpret(statements)
 
             intpr.error_reporter.update_source(orig_source)
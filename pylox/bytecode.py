@@ -0,0 +1,924 @@
+"""
+Bytecode compiler and interpreter loop for function bodies.
+
+Function bodies are compiled lazily (on the first call) into a flat
+list of integer opcodes plus a constant pool and are then executed by
+a single dispatch loop instead of the visitor double-dispatch.
+Constructs that are not covered by the compiler (nested functions,
+classes, property access, ...) make the compilation fail and the
+function falls back to the AST walking path in LoxFunction.call.
+"""
+from __future__ import annotations
+import sys
+from enum import IntEnum
+from typing import Any, Optional, TYPE_CHECKING
+from .expr import Expr, Literal, Grouping, Binary, Unary, Ternery, \
+        Variable, Assign, Logical, Call
+from .stmt import Stmt, Expression, Print, Var, Block, If, While, Break, \
+        Return
+from .lexer import TokenType
+from .environment import Environment, UNINITIALIZED
+from . import errors
+from . import callable as callable_
+
+if TYPE_CHECKING:
+    from .expr import Function, Get, Set, This, Super
+    from .stmt import FunDef, Class
+    from .interpreter import Interpreter
+    from .lexer import Token
+
+
+Op = IntEnum("Op", [
+    # constants and variables
+    "CONST",          # operand: constant index
+    "LOAD_AT",        # operands: distance, slot index
+    "STORE_AT",       # operands: distance, slot index
+    "LOAD_SLOT",      # operands: constant index of a values_array, slot
+    "STORE_SLOT",     # operands: constant index of a values_array, slot
+    "LOAD_GLOBAL",    # operand: constant index of the name Token
+    "STORE_GLOBAL",   # operand: constant index of the name Token
+    "STORE_LOCAL",    # operand: slot index; pops the initializer
+    "DEFINE_GLOBAL",  # operand: constant index of the name Token
+
+    # scopes
+    "PUSH_SCOPE",     # operand: slot count of the new scope
+    "POP_SCOPE",
+
+    # stack manipulation
+    "POP",
+    "PRINT",
+
+    # jumps (operand: absolute target)
+    "JUMP",
+    "JUMP_IF_FALSE",  # pops the condition
+    "JUMP_IF_TRUE",   # pops the condition
+    "JUMP_OR",        # keeps a truthy value, pops otherwise
+    "JUMP_AND",       # keeps a falsey value, pops otherwise
+
+    # operators (operand: constant index of the operator Token)
+    "ADD", "SUB", "MUL", "DIV",
+    "EQ", "NEQ",
+    "LT", "LE", "GT", "GE",
+    "NEGATE", "NOT",
+
+    # calls (operands: argument count, constant index of the paren Token)
+    "CALL",
+
+    # returns
+    "RETURN",         # return the value on top of the stack
+    "RETURN_NIL",
+
+    # quickened variants, never emitted by the compiler: a generic
+    # numeric op rewrites itself into its _FF form when it sees two
+    # floats, and the _FF form demotes itself back on a type miss
+    "ADD_FF", "SUB_FF", "MUL_FF", "DIV_FF",
+    "LT_FF", "LE_FF", "GT_FF", "GE_FF",
+])
+
+
+class Chunk:
+    """Compiled representation of a function body"""
+    code: list[int]
+    consts: list[Any]
+    frame_size: int
+    """Number of slots (parameters and top level variables) of the
+    function's own environment"""
+    captured: bool
+    """True if the chunk references environments of the closure chain
+    directly (such a chunk is only valid for one closure)"""
+
+    def __init__(self, code: list[int], consts: list[Any],
+                 frame_size: int = 0, captured: bool = False):
+        self.code = code
+        self.consts = consts
+        self.frame_size = frame_size
+        self.captured = captured
+
+
+class UnsupportedNode(Exception):
+    """Raised when the compiler hits a node it can't handle"""
+    pass
+
+
+# sentinel for LoxFunction._chunk ("not compiled yet")
+UNCOMPILED = object()
+
+# sentinel cached on a Function declaration whose chunk captures closure
+# environments and therefore has to be compiled once per closure
+PER_CLOSURE = object()
+
+# sentinel cached on a Function declaration whose body the compiler
+# can't handle (the _chunk_cache field defaults to None, which means
+# "not compiled yet")
+UNCOMPILABLE = object()
+
+
+class Compiler(Expr.Visitor, Stmt.Visitor):
+    """
+    Compile statements into a Chunk.
+
+    Uses the (distance, index) information the Resolver stored on the
+    interpreter to turn variable accesses into direct slot accesses.
+    """
+    interpreter: Interpreter
+    code: list[int]
+    consts: list[Any]
+
+    def __init__(self, interpreter: Interpreter,
+                 closure: Optional[Environment] = None,
+                 script: bool = False):
+        self.interpreter = interpreter
+        self.closure = closure
+        self.script = script
+        """True when compiling top-level statements instead of a
+        function body (declarations at depth 0 are then globals)"""
+        self.code = []
+        self.consts = []
+        self.break_jumps: list[list[int]] = []
+        # scope depth at each enclosing loop's entry, so break can pop
+        # the scopes opened inside the loop body before jumping out
+        self.break_scope_depths: list[int] = []
+        self.scope_depth = 0
+        self.captured = False
+        # number of slots defined so far, per open scope; mirrors the
+        # local_index counting of the Resolver
+        self.scope_slots: list[int] = [0]
+        # (type, value) -> constant index, for deduplicating literals
+        self.const_index: dict[Any, int] = {}
+
+    def compile_body(self, body: list[Stmt], arity: int = 0) -> Chunk:
+        """
+        Compile a list of statements.
+        :raises: UnsupportedNode if the statements can't be compiled
+        """
+        self.scope_slots[0] = arity
+        for statement in body:
+            statement.accept(self)
+        self.__emit(Op.RETURN_NIL)
+        return Chunk(self.code, self.consts, self.scope_slots[0],
+                     self.captured)
+
+    def __emit(self, *values: int):
+        self.code.extend(values)
+
+    # literal types that are safe to deduplicate by value; the type is
+    # part of the key so e.g. 0.0 and false stay distinct entries
+    DEDUP_TYPES = (float, str, bool, type(None))
+
+    def __emit_const(self, value: Any) -> int:
+        if type(value) in self.DEDUP_TYPES:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            key = (type(value), value)
+            index = self.const_index.get(key)
+            if index is None:
+                index = len(self.consts)
+                self.consts.append(value)
+                self.const_index[key] = index
+            return index
+        index = len(self.consts)
+        self.consts.append(value)
+        return index
+
+    def __emit_jump(self, op: Op) -> int:
+        """Emit a jump with a placeholder target, return the operand's
+        position for later patching."""
+        self.__emit(op, 0)
+        return len(self.code) - 1
+
+    def __patch_jump(self, operand_pos: int):
+        self.code[operand_pos] = len(self.code)
+
+    def __resolved(self, node):
+        return node._depth, node._slot
+
+    ###########################################################################
+    # Expr.Visitor
+    def visit_literal_expr(self, expr: Literal):
+        self.__emit(Op.CONST, self.__emit_const(expr.value))
+
+    def visit_grouping_expr(self, expr: Grouping):
+        expr.expression.accept(self)
+
+    def __closure_slot(self, distance: int) -> Optional[int]:
+        """
+        If 'distance' points beyond the compiled frame into the closure
+        chain, the target environment is already known at compile time.
+        Return the constant index of its values_array (else None).
+        """
+        if self.closure is None or distance <= self.scope_depth:
+            return None
+        target = self.closure.ancestor_fast(distance - self.scope_depth - 1)
+        self.captured = True
+        return self.__emit_const(target.values_array)
+
+    def visit_variable_expr(self, expr: Variable):
+        distance, index = self.__resolved(expr)
+        if distance is not None and index is not None:
+            slot = self.__closure_slot(distance)
+            if slot is not None:
+                self.__emit(Op.LOAD_SLOT, slot, index)
+            else:
+                self.__emit(Op.LOAD_AT, distance, index)
+        else:
+            self.__emit(Op.LOAD_GLOBAL, self.__emit_const(expr.name))
+
+    def visit_assign_expr(self, expr: Assign):
+        expr.value.accept(self)
+        distance, index = self.__resolved(expr)
+        if distance is not None and index is not None:
+            slot = self.__closure_slot(distance)
+            if slot is not None:
+                self.__emit(Op.STORE_SLOT, slot, index)
+            else:
+                self.__emit(Op.STORE_AT, distance, index)
+        else:
+            self.__emit(Op.STORE_GLOBAL, self.__emit_const(expr.name))
+
+    def visit_unary_expr(self, expr: Unary):
+        expr.right.accept(self)
+        if expr.operator.type == TokenType.MINUS:
+            self.__emit(Op.NEGATE, self.__emit_const(expr.operator))
+        else:
+            self.__emit(Op.NOT)
+
+    BINARY_OPS = {
+        TokenType.PLUS: Op.ADD,
+        TokenType.MINUS: Op.SUB,
+        TokenType.STAR: Op.MUL,
+        TokenType.SLASH: Op.DIV,
+        TokenType.EQUAL_EQUAL: Op.EQ,
+        TokenType.BANG_EQUAL: Op.NEQ,
+        TokenType.LESS: Op.LT,
+        TokenType.LESS_EQUAL: Op.LE,
+        TokenType.GREATER: Op.GT,
+        TokenType.GREATER_EQUAL: Op.GE,
+    }
+
+    def visit_binary_expr(self, expr: Binary):
+        expr.left.accept(self)
+        expr.right.accept(self)
+        op = Compiler.BINARY_OPS.get(expr.operator.type)
+        if op is None:
+            raise UnsupportedNode()
+        self.__emit(op, self.__emit_const(expr.operator))
+
+    def visit_logical_expr(self, expr: Logical):
+        expr.left.accept(self)
+        if expr.operator.type == TokenType.OR:
+            end = self.__emit_jump(Op.JUMP_OR)
+        else:
+            end = self.__emit_jump(Op.JUMP_AND)
+        expr.right.accept(self)
+        self.__patch_jump(end)
+
+    def visit_ternery_expr(self, expr: Ternery):
+        expr.condition.accept(self)
+        else_jump = self.__emit_jump(Op.JUMP_IF_FALSE)
+        expr.then_expr.accept(self)
+        end_jump = self.__emit_jump(Op.JUMP)
+        self.__patch_jump(else_jump)
+        expr.else_expr.accept(self)
+        self.__patch_jump(end_jump)
+
+    def visit_call_expr(self, expr: Call):
+        expr.callee.accept(self)
+        for arg in expr.arguments:
+            arg.accept(self)
+        self.__emit(Op.CALL,
+                    len(expr.arguments),
+                    self.__emit_const(expr.paren))
+
+    def visit_function_expr(self, expr: Function):
+        raise UnsupportedNode()
+
+    def visit_get_expr(self, expr: Get):
+        raise UnsupportedNode()
+
+    def visit_set_expr(self, expr: Set):
+        raise UnsupportedNode()
+
+    def visit_this_expr(self, expr: This):
+        raise UnsupportedNode()
+
+    def visit_super_expr(self, expr: Super):
+        raise UnsupportedNode()
+
+    ###########################################################################
+    # Stmt.Visitor
+    def visit_expression_stmt(self, stmt: Expression):
+        stmt.expression.accept(self)
+        self.__emit(Op.POP)
+
+    def visit_print_stmt(self, stmt: Print):
+        stmt.expression.accept(self)
+        self.__emit(Op.PRINT)
+
+    def visit_var_stmt(self, stmt: Var):
+        if stmt.initializer is not None:
+            stmt.initializer.accept(self)
+        else:
+            self.__emit(Op.CONST, self.__emit_const(UNINITIALIZED))
+        if self.script and self.scope_depth == 0:
+            self.__emit(Op.DEFINE_GLOBAL, self.__emit_const(stmt.name))
+            return
+        # slots are handed out in declaration order, exactly like the
+        # local_index the Resolver assigned
+        slot = self.scope_slots[-1]
+        self.scope_slots[-1] = slot + 1
+        self.__emit(Op.STORE_LOCAL, slot)
+
+    def visit_block_stmt(self, stmt: Block):
+        if stmt._scopeless:
+            # the resolver didn't count this block as a scope
+            for statement in stmt.statements:
+                statement.accept(self)
+            return
+        self.__emit(Op.PUSH_SCOPE, 0)
+        size_pos = len(self.code) - 1
+        self.scope_depth += 1
+        self.scope_slots.append(0)
+        for statement in stmt.statements:
+            statement.accept(self)
+        self.code[size_pos] = self.scope_slots.pop()
+        self.scope_depth -= 1
+        self.__emit(Op.POP_SCOPE)
+
+    def __compile_condition(self, condition: Expr) -> list[int]:
+        """
+        Compile a branch condition so that execution falls through
+        when it is truthy. Logical operators branch directly instead
+        of producing a boolean that is tested again; the returned jump
+        operand positions have to be patched to the falsey target.
+        """
+        if type(condition) is Logical:
+            if condition.operator.type == TokenType.AND:
+                false_jumps = self.__compile_condition(condition.left)
+                false_jumps += self.__compile_condition(condition.right)
+                return false_jumps
+            # OR: a truthy left short-circuits straight to the
+            # fall-through point behind the whole condition
+            condition.left.accept(self)
+            true_jump = self.__emit_jump(Op.JUMP_IF_TRUE)
+            false_jumps = self.__compile_condition(condition.right)
+            self.__patch_jump(true_jump)
+            return false_jumps
+        condition.accept(self)
+        return [self.__emit_jump(Op.JUMP_IF_FALSE)]
+
+    def visit_if_stmt(self, stmt: If):
+        else_jumps = self.__compile_condition(stmt.condition)
+        stmt.then_branch.accept(self)
+        if stmt.else_branch is not None:
+            end_jump = self.__emit_jump(Op.JUMP)
+            for operand_pos in else_jumps:
+                self.__patch_jump(operand_pos)
+            stmt.else_branch.accept(self)
+            self.__patch_jump(end_jump)
+        else:
+            for operand_pos in else_jumps:
+                self.__patch_jump(operand_pos)
+
+    def visit_while_stmt(self, stmt: While):
+        loop_start = len(self.code)
+        end_jumps = self.__compile_condition(stmt.condition)
+        self.break_jumps.append([])
+        self.break_scope_depths.append(self.scope_depth)
+        stmt.body.accept(self)
+        self.__emit(Op.JUMP, loop_start)
+        for operand_pos in end_jumps:
+            self.__patch_jump(operand_pos)
+        self.break_scope_depths.pop()
+        for operand_pos in self.break_jumps.pop():
+            self.__patch_jump(operand_pos)
+
+    def visit_break_stmt(self, stmt: Break):
+        if len(self.break_jumps) == 0:
+            # 'break' outside of a loop in this compilation unit;
+            # leave it to the AST path
+            raise UnsupportedNode()
+        # unwind the scopes opened since loop entry; the jump target
+        # lies outside them and PUSH_SCOPE/POP_SCOPE must stay balanced
+        for _ in range(self.scope_depth - self.break_scope_depths[-1]):
+            self.__emit(Op.POP_SCOPE)
+        self.break_jumps[-1].append(self.__emit_jump(Op.JUMP))
+
+    def visit_return_stmt(self, stmt: Return):
+        if stmt.value is None:
+            self.__emit(Op.RETURN_NIL)
+        else:
+            stmt.value.accept(self)
+            self.__emit(Op.RETURN)
+
+    def visit_fundef_stmt(self, stmt: FunDef):
+        raise UnsupportedNode()
+
+    def visit_class_stmt(self, stmt: Class):
+        raise UnsupportedNode()
+
+
+def compile_script(statements: list[Stmt],
+                   interpreter: Interpreter) -> Optional[Chunk]:
+    """
+    Try to compile a whole top-level statement list.
+    Returns None if any statement isn't supported by the compiler.
+    """
+    try:
+        return Compiler(interpreter, script=True).compile_body(statements)
+    except UnsupportedNode:
+        return None
+
+
+def compile_function(declaration: Function,
+                     interpreter: Interpreter,
+                     closure: Optional[Environment] = None
+                     ) -> Optional[Chunk]:
+    """
+    Compile a function body into a Chunk.
+    Return None if the body contains unsupported constructs.
+    """
+    try:
+        return Compiler(interpreter, closure).compile_body(
+                declaration.body, len(declaration.params))
+    except UnsupportedNode:
+        return None
+
+
+def _is_falsey(value: Any) -> bool:
+    return value is None or value is False
+
+
+class _Frame:
+    """Mutable execution state of one run_chunk invocation"""
+    __slots__ = ("interpreter", "consts", "stack", "env", "result")
+
+    def __init__(self, interpreter: Interpreter, consts: list[Any],
+                 env: Environment):
+        self.interpreter = interpreter
+        self.consts = consts
+        self.stack: list[Any] = []
+        self.env = env
+        self.result: Any = None
+
+
+def run_chunk(interpreter: Interpreter, chunk: Chunk, env: Environment):
+    """
+    Execute a compiled Chunk and return the function's return value.
+    """
+    code = chunk.code
+    handlers = HANDLERS
+    frame = _Frame(interpreter, chunk.consts, env)
+    pc = 0
+
+    # Each handler returns the next pc; RETURN/RETURN_NIL store the
+    # result on the frame and return -1 to stop the loop.
+    while pc >= 0:
+        pc = handlers[code[pc]](frame, code, pc)
+
+    return frame.result
+
+
+###############################################################################
+# opcode handlers
+def _op_const(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.stack.append(frame.consts[code[pc+1]])
+    return pc + 2
+
+
+def _op_load_at(frame: _Frame, code: list[int], pc: int) -> int:
+    target = frame.env
+    for _ in range(code[pc+1]):
+        target = target.enclosing
+    frame.stack.append(target.values_array[code[pc+2]])
+    return pc + 3
+
+
+def _op_store_at(frame: _Frame, code: list[int], pc: int) -> int:
+    target = frame.env
+    for _ in range(code[pc+1]):
+        target = target.enclosing
+    target.values_array[code[pc+2]] = frame.stack[-1]
+    return pc + 3
+
+
+def _op_load_slot(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.stack.append(frame.consts[code[pc+1]][code[pc+2]])
+    return pc + 3
+
+
+def _op_store_slot(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.consts[code[pc+1]][code[pc+2]] = frame.stack[-1]
+    return pc + 3
+
+
+def _op_load_global(frame: _Frame, code: list[int], pc: int) -> int:
+    # the const starts out as the name Token; once the global's slot
+    # is known the entry is rewritten to a (slot, token) pair so later
+    # executions skip the name hash entirely
+    glob = frame.interpreter.global_environment
+    entry = frame.consts[code[pc+1]]
+    if type(entry) is tuple:
+        value = glob.values[entry[0]]
+        if value is UNINITIALIZED:
+            raise errors.LoxRuntimeError(
+                    entry[1],
+                    "Uninitialized variable '{}'.", entry[1].lexeme)
+    else:
+        slot = glob.slot(entry)
+        frame.consts[code[pc+1]] = (slot, entry)
+        value = glob.values[slot]
+        if value is UNINITIALIZED:
+            raise errors.LoxRuntimeError(
+                    entry,
+                    "Uninitialized variable '{}'.", entry.lexeme)
+    frame.stack.append(value)
+    return pc + 2
+
+
+def _op_store_global(frame: _Frame, code: list[int], pc: int) -> int:
+    glob = frame.interpreter.global_environment
+    entry = frame.consts[code[pc+1]]
+    if type(entry) is not tuple:
+        entry = (glob.slot(entry), entry)
+        frame.consts[code[pc+1]] = entry
+    glob.values[entry[0]] = frame.stack[-1]
+    return pc + 2
+
+
+def _op_define_global(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.interpreter.global_environment.define(frame.consts[code[pc+1]],
+                                                frame.stack.pop())
+    return pc + 2
+
+
+def _op_store_local(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.env.values_array[code[pc+1]] = frame.stack.pop()
+    return pc + 2
+
+
+def _op_push_scope(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.env = Environment(frame.env, code[pc+1])
+    return pc + 2
+
+
+def _op_pop_scope(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.env = frame.env.enclosing
+    return pc + 1
+
+
+def _op_pop(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.stack.pop()
+    return pc + 1
+
+
+def _op_print(frame: _Frame, code: list[int], pc: int) -> int:
+    print(frame.interpreter.stringify(frame.stack.pop()))
+    return pc + 1
+
+
+def _op_jump(frame: _Frame, code: list[int], pc: int) -> int:
+    return code[pc+1]
+
+
+def _op_jump_if_false(frame: _Frame, code: list[int], pc: int) -> int:
+    value = frame.stack.pop()
+    if value is None or value is False:
+        return code[pc+1]
+    return pc + 2
+
+
+def _op_jump_if_true(frame: _Frame, code: list[int], pc: int) -> int:
+    value = frame.stack.pop()
+    if value is None or value is False:
+        return pc + 2
+    return code[pc+1]
+
+
+def _op_jump_or(frame: _Frame, code: list[int], pc: int) -> int:
+    if frame.stack[-1] is None or frame.stack[-1] is False:
+        frame.stack.pop()
+        return pc + 2
+    return code[pc+1]
+
+
+def _op_jump_and(frame: _Frame, code: list[int], pc: int) -> int:
+    if frame.stack[-1] is None or frame.stack[-1] is False:
+        return code[pc+1]
+    frame.stack.pop()
+    return pc + 2
+
+
+def _op_add(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.ADD_FF
+        stack.append(left + right)
+    else:
+        stack.append(_add(left, right, frame.consts[code[pc+1]]))
+    return pc + 2
+
+
+def _op_add_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        stack.append(left + right)
+    else:
+        code[pc] = Op.ADD
+        stack.append(_add(left, right, frame.consts[code[pc+1]]))
+    return pc + 2
+
+
+def _op_sub(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.SUB_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left - right)
+    return pc + 2
+
+
+def _op_sub_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.SUB
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left - right)
+    return pc + 2
+
+
+def _op_mul(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.MUL_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left * right)
+    return pc + 2
+
+
+def _op_mul_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.MUL
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left * right)
+    return pc + 2
+
+
+def _op_div(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.DIV_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    if right == 0:
+        raise errors.LoxRuntimeError(frame.consts[code[pc+1]],
+                                     "Do not divide by zero!")
+    stack.append(left / right)
+    return pc + 2
+
+
+def _op_div_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.DIV
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    if right == 0:
+        raise errors.LoxRuntimeError(frame.consts[code[pc+1]],
+                                     "Do not divide by zero!")
+    stack.append(left / right)
+    return pc + 2
+
+
+def _op_eq(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() == right)
+    return pc + 2
+
+
+def _op_neq(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() != right)
+    return pc + 2
+
+
+def _op_lt(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.LT_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left < right)
+    return pc + 2
+
+
+def _op_lt_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.LT
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left < right)
+    return pc + 2
+
+
+def _op_le(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.LE_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left <= right)
+    return pc + 2
+
+
+def _op_le_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.LE
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left <= right)
+    return pc + 2
+
+
+def _op_gt(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.GT_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left > right)
+    return pc + 2
+
+
+def _op_gt_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.GT
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left > right)
+    return pc + 2
+
+
+def _op_ge(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is float is type(right):
+        code[pc] = Op.GE_FF
+    else:
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left >= right)
+    return pc + 2
+
+
+def _op_ge_ff(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if type(left) is not float or type(right) is not float:
+        code[pc] = Op.GE
+        _check_numbers(left, right, frame.consts[code[pc+1]])
+    stack.append(left >= right)
+    return pc + 2
+
+
+def _op_negate(frame: _Frame, code: list[int], pc: int) -> int:
+    value = frame.stack.pop()
+    if not isinstance(value, float):
+        raise errors.LoxRuntimeError(frame.consts[code[pc+1]],
+                                     "Operand must be a number.")
+    frame.stack.append(-value)
+    return pc + 2
+
+
+def _op_not(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.stack.append(_is_falsey(frame.stack.pop()))
+    return pc + 1
+
+
+def _op_call(frame: _Frame, code: list[int], pc: int) -> int:
+    stack = frame.stack
+    argc = code[pc+1]
+    arguments = stack[len(stack)-argc:]
+    del stack[len(stack)-argc:]
+    callee = stack.pop()
+    if not isinstance(callee, callable_.LoxCallable):
+        raise errors.LoxRuntimeError(
+                frame.consts[code[pc+2]],
+                "Can only call functions and classes.")
+    if argc != callee.arity():
+        raise errors.LoxRuntimeError(
+                frame.consts[code[pc+2]],
+                "Expected " + str(callee.arity())
+                + " arguments, but got "
+                + str(argc) + ".")
+    stack.append(callee.call(frame.interpreter, arguments))
+    return pc + 3
+
+
+def _op_return(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.result = frame.stack.pop()
+    return -1
+
+
+def _op_return_nil(frame: _Frame, code: list[int], pc: int) -> int:
+    frame.result = None
+    return -1
+
+
+# opcode-indexed handler table (IntEnum values start at 1)
+HANDLERS: list[Any] = [None] * (len(Op) + 1)
+HANDLERS[Op.CONST] = _op_const
+HANDLERS[Op.LOAD_AT] = _op_load_at
+HANDLERS[Op.STORE_AT] = _op_store_at
+HANDLERS[Op.LOAD_SLOT] = _op_load_slot
+HANDLERS[Op.STORE_SLOT] = _op_store_slot
+HANDLERS[Op.LOAD_GLOBAL] = _op_load_global
+HANDLERS[Op.STORE_GLOBAL] = _op_store_global
+HANDLERS[Op.STORE_LOCAL] = _op_store_local
+HANDLERS[Op.DEFINE_GLOBAL] = _op_define_global
+HANDLERS[Op.PUSH_SCOPE] = _op_push_scope
+HANDLERS[Op.POP_SCOPE] = _op_pop_scope
+HANDLERS[Op.POP] = _op_pop
+HANDLERS[Op.PRINT] = _op_print
+HANDLERS[Op.JUMP] = _op_jump
+HANDLERS[Op.JUMP_IF_FALSE] = _op_jump_if_false
+HANDLERS[Op.JUMP_IF_TRUE] = _op_jump_if_true
+HANDLERS[Op.JUMP_OR] = _op_jump_or
+HANDLERS[Op.JUMP_AND] = _op_jump_and
+HANDLERS[Op.ADD] = _op_add
+HANDLERS[Op.SUB] = _op_sub
+HANDLERS[Op.MUL] = _op_mul
+HANDLERS[Op.DIV] = _op_div
+HANDLERS[Op.EQ] = _op_eq
+HANDLERS[Op.NEQ] = _op_neq
+HANDLERS[Op.LT] = _op_lt
+HANDLERS[Op.LE] = _op_le
+HANDLERS[Op.GT] = _op_gt
+HANDLERS[Op.GE] = _op_ge
+HANDLERS[Op.NEGATE] = _op_negate
+HANDLERS[Op.NOT] = _op_not
+HANDLERS[Op.CALL] = _op_call
+HANDLERS[Op.RETURN] = _op_return
+HANDLERS[Op.RETURN_NIL] = _op_return_nil
+HANDLERS[Op.ADD_FF] = _op_add_ff
+HANDLERS[Op.SUB_FF] = _op_sub_ff
+HANDLERS[Op.MUL_FF] = _op_mul_ff
+HANDLERS[Op.DIV_FF] = _op_div_ff
+HANDLERS[Op.LT_FF] = _op_lt_ff
+HANDLERS[Op.LE_FF] = _op_le_ff
+HANDLERS[Op.GT_FF] = _op_gt_ff
+HANDLERS[Op.GE_FF] = _op_ge_ff
+
+
+def _check_numbers(left: Any, right: Any, operator: Token):
+    if isinstance(left, float) and isinstance(right, float):
+        return
+    raise errors.LoxRuntimeError(operator, "Both operands mus be numbers.")
+
+
+def _add(left: Any, right: Any, operator: Token):
+    """Implements the Lox '+' operator (numbers, strings and the
+    implicit string conversion)."""
+    if isinstance(left, str) and isinstance(right, str):
+        return left + right
+    if isinstance(left, float) and isinstance(right, float):
+        return left + right
+    if isinstance(left, float) and isinstance(right, str):
+        return str(left) + right
+    if isinstance(left, str) and isinstance(right, float):
+        return left + str(right)
+    raise errors.LoxRuntimeError(
+            operator,
+            "Both operands have to be strings or numbers.")
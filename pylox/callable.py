@@ -3,6 +3,8 @@ from typing import Any, TYPE_CHECKING, Optional
 from abc import ABC, abstractmethod
 from . import environment
 from . import errors
+from . import bytecode
+from . import jit
 
 if TYPE_CHECKING:
     from .interpreter import Interpreter
@@ -26,6 +28,34 @@ class LoxCallable(ABC):
         pass
 
 
+def _bind0(values: list[Any], args: list[Any]):
+    pass
+
+
+def _bind1(values: list[Any], args: list[Any]):
+    values[0] = args[0]
+
+
+def _bind2(values: list[Any], args: list[Any]):
+    values[0] = args[0]
+    values[1] = args[1]
+
+
+def _bind3(values: list[Any], args: list[Any]):
+    values[0] = args[0]
+    values[1] = args[1]
+    values[2] = args[2]
+
+
+def _bind_n(values: list[Any], args: list[Any]):
+    for i, arg in enumerate(args):
+        values[i] = arg
+
+
+# unrolled argument-slot binders indexed by arity
+_BINDERS = (_bind0, _bind1, _bind2, _bind3)
+
+
 class LoxFunction(LoxCallable):
     name: Optional[str]
     declaration: Function
@@ -43,28 +73,112 @@ class LoxFunction(LoxCallable):
         self.closure = closure
         self.is_initializer = is_initializer
         self.__arity = len(declaration.params)
+        self._chunk = bytecode.UNCOMPILED
+        self._jitted: Any = jit.UNTRIED
+        self._jit_recursive = False
+        self._bind = _BINDERS[self.__arity] \
+            if self.__arity < len(_BINDERS) else _bind_n
 
     def call(self, interpreter: Interpreter, arguments: list[Any]):
-        env: Environment = environment.Environment(self.closure)
+        jitted = self._jitted
+        if jitted is jit.UNTRIED:
+            # initializers must return 'this' no matter what the body
+            # says, which the translated function can't do
+            translated = None if self.is_initializer \
+                else jit.maybe_jit(self.name, self.declaration)
+            if translated is None:
+                jitted = None
+            else:
+                jitted, self._jit_recursive = translated
+                if self._jit_recursive and self.closure is not None:
+                    # a local name can be rebound in its scope, and
+                    # slot-addressed environments can't be probed by
+                    # name to notice, so only globals get the
+                    # recursive fast path
+                    jitted = None
+            self._jitted = jitted
+        if jitted is not None and self._jit_recursive:
+            # the generated body calls its exec'd self directly, but
+            # Lox resolves the callee per call: skip the fast path
+            # while the global name is bound to something else
+            glob = interpreter.global_environment
+            slot = glob.name_to_slot.get(self.name)
+            if slot is None or glob.values[slot] is not self:
+                jitted = None
+        if jitted is not None:
+            for arg in arguments:
+                if type(arg) is not float:
+                    break
+            else:
+                try:
+                    return jitted(*arguments)
+                except Exception:
+                    # translated bodies are pure, so the interpreter
+                    # paths below can redo the call and report the
+                    # error the Lox way
+                    self._jitted = None
 
-        for i, arg in enumerate(arguments):
-            env.define(self.declaration.params[i], arg)
+        chunk = self._chunk
+        if chunk is bytecode.UNCOMPILED:
+            chunk = self.__compile(interpreter)
+            self._chunk = chunk
 
-        try:
-            interpreter.execute_block(self.declaration.body, env)
-        except errors.LoxReturn as lox_return:
+        if chunk is not None:
+            # compiled bodies contain no function declarations, so the
+            # frame environment can't escape into a closure and may be
+            # pooled
+            env = environment.Environment.acquire(self.closure,
+                                                  chunk.frame_size)
+            self._bind(env.values_array, arguments)
+            try:
+                value = interpreter.run_chunk(chunk, env)
+            finally:
+                environment.Environment.release(env)
             if self.is_initializer:
                 if self.closure is None:
                     print("SHOULD NOT HAPPEN! in callable.py")
                     return
                 return self.closure.get_at(0, 0, "this")
-            return lox_return.value
+            return value
+
+        env: Environment = environment.Environment(self.closure)
+        for i, arg in enumerate(arguments):
+            env.define(self.declaration.params[i], arg)
+
+        status = interpreter.execute_block(self.declaration.body, env)
 
         if self.is_initializer:
             if self.closure is None:
                 print("SHOULD NOT HAPPEN! in callable.py")
                 return
             return self.closure.get_at(0, 0, "this")
+        if status == errors.RETURNED:
+            return interpreter._return_value
+        return None
+
+    def __compile(self, interpreter: Interpreter):
+        """
+        Compile the function body, reusing results cached on the
+        declaration node: chunks that don't capture closure environments
+        are shared between all LoxFunctions of the same declaration,
+        failed compilations are never retried.
+        """
+        declaration = self.declaration
+        cached = declaration._chunk_cache
+        if cached is bytecode.UNCOMPILABLE:
+            return None
+        if isinstance(cached, bytecode.Chunk):
+            return cached
+        chunk = bytecode.compile_function(declaration,
+                                          interpreter,
+                                          self.closure)
+        if chunk is None:
+            declaration._chunk_cache = bytecode.UNCOMPILABLE
+        elif chunk.captured:
+            declaration._chunk_cache = bytecode.PER_CLOSURE
+        else:
+            declaration._chunk_cache = chunk
+        return chunk
 
     def arity(self):
         return self.__arity
@@ -13,19 +13,67 @@ UNINITIALIZED = object()
 
 class Environment:
     """An environment holding variables and their values"""
+    __slots__ = ("values_array", "enclosing")
+
     values_array: list[Any]
     enclosing: Optional[Environment]
 
-    def __init__(self, enclosing: Optional[Environment] = None):
-        self.values_array = []
+    _pool: dict[int, list[Environment]] = {}
+    """Free-list of released frame environments, keyed by slot count"""
+    _POOL_LIMIT = 64
+
+    def __init__(self, enclosing: Optional[Environment] = None,
+                 size: int = 0):
+        # when the slot count is known ahead of time (compiled code)
+        # the array is allocated in one go instead of append by append
+        self.values_array = [UNINITIALIZED] * size if size else []
         self.enclosing = enclosing
 
+    @classmethod
+    def acquire(cls, enclosing: Optional[Environment],
+                size: int) -> Environment:
+        """
+        Get an environment with 'size' slots, reusing a released one if
+        available. Only environments that can't outlive their call (no
+        function declared inside them) may be managed this way.
+        """
+        free = cls._pool.get(size)
+        if free:
+            env = free.pop()
+            env.enclosing = enclosing
+            values = env.values_array
+            for i in range(size):
+                values[i] = UNINITIALIZED
+            return env
+        return cls(enclosing, size)
+
+    @classmethod
+    def release(cls, env: Environment):
+        """Put an environment back into the pool"""
+        env.enclosing = None
+        free = cls._pool.setdefault(len(env.values_array), [])
+        if len(free) < cls._POOL_LIMIT:
+            free.append(env)
+
     def define(self, name: Optional[Token], value: Any = UNINITIALIZED):
         """Define a new variable and initialize it with 'value'"""
         self.values_array.append(value)
 
     def get_at(self, distance: int, index: int, name: str):
-        return self.ancestor(distance).values_array[index]
+        return self.ancestor_fast(distance).values_array[index]
+
+    def ancestor_fast(self, distance: int) -> Environment:
+        """
+        Like ancestor, but with the common small distances unrolled so
+        no loop is set up for them.
+        """
+        if distance == 0:
+            return self
+        if distance == 1:
+            return self.enclosing
+        if distance == 2:
+            return self.enclosing.enclosing
+        return self.ancestor(distance)
 
     def ancestor(self, distance: int) -> Environment:
         environment: Environment = self
@@ -41,4 +89,4 @@ class Environment:
         return environment
 
     def assign_at(self, distance: int, index: int, name: Token, value: Any):
-        self.ancestor(distance).values_array[index] = value
+        self.ancestor_fast(distance).values_array[index] = value
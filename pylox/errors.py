@@ -1,26 +1,36 @@
-from typing import Any
 from .lexer import Token
 
 
 class LoxRuntimeError(Exception):
-    """Thrown when an error occures during runtime"""
+    """
+    Thrown when an error occures during runtime.
+
+    The message may be a format template plus arguments; it is only
+    formatted when actually read, so raise sites don't pay for string
+    building when the error is caught and discarded.
+    """
     def __init__(self,
                  token: Token,
                  message: str,
                  *args: object):
         super().__init__(message, args)
         self.token = token
-        self.message = message
+        self._template = message
+        self._args = args
 
+    @property
+    def message(self) -> str:
+        if self._args:
+            return self._template.format(*self._args)
+        return self._template
 
-class LoxReturn(Exception):
-    """Thrown by return statements"""
-    def __init__(self, value: Any = None):
-        super().__init__()
-        self.value = value
+    def __str__(self) -> str:
+        return self.message
 
 
-class LoxBreak(Exception):
-    """Thrown by break statements"""
-    def __init__(self):
-        super().__init__()
+# status codes returned by the statement visitors instead of raising
+# exceptions for return/break (raise+catch is far too expensive for the
+# per-call hot path)
+NORMAL = 0
+BREAK = 1
+RETURNED = 2
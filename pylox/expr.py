@@ -6,13 +6,19 @@ Note: this file is generated automatically by tool/ast_generator.py
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional
 from .lexer import Token, LiteralType
 from . import stmt
 
+# 'not cached yet' marker for cache slots whose cached value may
+# legitimately be None
+_UNCACHED: Any = object()
+
 
 class Expr(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: Visitor):
         pass
@@ -75,53 +81,64 @@ class Expr(ABC):
             pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Binary(Expr):
+    OP: ClassVar[int] = 0
     left: Expr
     operator: Token
     right: Expr
+    _fn: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_binary_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(Expr):
+    OP: ClassVar[int] = 1
     callee: Expr
     paren: Token
     arguments: list[Expr]
+    _cached_fn: Any = field(default=_UNCACHED, init=False, repr=False, compare=False)
+    _cached_arity: Any = field(default=None, init=False, repr=False, compare=False)
+    _cached_call: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_call_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Unary(Expr):
+    OP: ClassVar[int] = 2
     operator: Token
     right: Expr
+    _fn: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_unary_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Grouping(Expr):
+    OP: ClassVar[int] = 3
     expression: Expr
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_grouping_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Literal(Expr):
+    OP: ClassVar[int] = 4
     value: LiteralType
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_literal_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Ternery(Expr):
+    OP: ClassVar[int] = 5
     condition: Expr
     then_expr: Expr
     else_expr: Expr
@@ -130,53 +147,69 @@ class Ternery(Expr):
         return visitor.visit_ternery_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable(Expr):
+    OP: ClassVar[int] = 6
     name: Token
+    _depth: Any = field(default=None, init=False, repr=False, compare=False)
+    _slot: Any = field(default=None, init=False, repr=False, compare=False)
+    _g_slot: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_variable_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Assign(Expr):
+    OP: ClassVar[int] = 7
     name: Token
     value: Expr
+    _depth: Any = field(default=None, init=False, repr=False, compare=False)
+    _slot: Any = field(default=None, init=False, repr=False, compare=False)
+    _g_slot: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_assign_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Logical(Expr):
+    OP: ClassVar[int] = 8
     left: Expr
     operator: Token
     right: Expr
+    _fn: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_logical_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Function(Expr):
+    OP: ClassVar[int] = 9
     params: list[Token]
     body: list[stmt.Stmt]
+    _chunk_cache: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_function_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Get(Expr):
+    OP: ClassVar[int] = 10
     object: Expr
     name: Token
+    _ic_class: Any = field(default=None, init=False, repr=False, compare=False)
+    _ic_method: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_get_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Set(Expr):
+    OP: ClassVar[int] = 11
     object: Expr
     name: Token
     value: Expr
@@ -185,19 +218,25 @@ class Set(Expr):
         return visitor.visit_set_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class This(Expr):
+    OP: ClassVar[int] = 12
     keyword: Token
+    _depth: Any = field(default=None, init=False, repr=False, compare=False)
+    _slot: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_this_expr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Super(Expr):
+    OP: ClassVar[int] = 13
     keyword: Token
     method: Token
     superclass: Optional[Token]
+    _depth: Any = field(default=None, init=False, repr=False, compare=False)
+    _slot: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Expr.Visitor):
         return visitor.visit_super_expr(self)
@@ -0,0 +1,159 @@
+"""
+Constant folding over the AST.
+
+Sub-trees built purely from literals are collapsed into a single
+Literal node once, so loops don't re-evaluate them on every
+iteration. Folding happens in place after resolving (Literal nodes
+carry no resolver state) and is careful to never fold anything whose
+runtime behaviour is an error — a division by a literal zero, for
+example, stays in the tree so it still raises when executed.
+"""
+from __future__ import annotations
+from .expr import Expr, Literal, Grouping, Binary, Unary, Ternery, \
+        Variable, Assign, Logical, Call, Function, Get, Set, This, Super
+from .stmt import Stmt, Expression, Print, Var, Block, If, While, Break, \
+        FunDef, Return, Class
+from .lexer import TokenType
+
+
+def _is_falsey(value) -> bool:
+    return value is None or value is False
+
+
+def _fold_binary(expr: Binary) -> Expr:
+    left = expr.left.value
+    right = expr.right.value
+    operator = expr.operator.type
+    if operator == TokenType.PLUS:
+        left_type, right_type = type(left), type(right)
+        if left_type is float and right_type is float:
+            return Literal(left + right)
+        if left_type is str and right_type is str:
+            return Literal(left + right)
+        if left_type is float and right_type is str:
+            return Literal(str(left) + right)
+        if left_type is str and right_type is float:
+            return Literal(left + str(right))
+        return expr
+    if operator in (TokenType.EQUAL_EQUAL, TokenType.BANG_EQUAL):
+        equal = left == right
+        return Literal(equal if operator == TokenType.EQUAL_EQUAL
+                       else not equal)
+    if type(left) is not float or type(right) is not float:
+        return expr
+    match operator:
+        case TokenType.MINUS:
+            return Literal(left - right)
+        case TokenType.STAR:
+            return Literal(left * right)
+        case TokenType.SLASH:
+            if right == 0:
+                # folding would swallow the runtime error
+                return expr
+            return Literal(left / right)
+        case TokenType.GREATER:
+            return Literal(left > right)
+        case TokenType.GREATER_EQUAL:
+            return Literal(left >= right)
+        case TokenType.LESS:
+            return Literal(left < right)
+        case TokenType.LESS_EQUAL:
+            return Literal(left <= right)
+    return expr
+
+
+def _fold_expr(expr: Expr) -> Expr:
+    node_type = type(expr)
+    if node_type is Literal or node_type is Variable \
+            or node_type is This or node_type is Super:
+        return expr
+    if node_type is Grouping:
+        expr.expression = _fold_expr(expr.expression)
+        if type(expr.expression) is Literal:
+            return expr.expression
+        return expr
+    if node_type is Binary:
+        expr.left = _fold_expr(expr.left)
+        expr.right = _fold_expr(expr.right)
+        if type(expr.left) is Literal and type(expr.right) is Literal:
+            return _fold_binary(expr)
+        return expr
+    if node_type is Unary:
+        expr.right = _fold_expr(expr.right)
+        if type(expr.right) is Literal:
+            value = expr.right.value
+            if expr.operator.type == TokenType.MINUS:
+                if type(value) is float:
+                    return Literal(-value)
+            else:
+                return Literal(_is_falsey(value))
+        return expr
+    if node_type is Ternery:
+        expr.condition = _fold_expr(expr.condition)
+        expr.then_expr = _fold_expr(expr.then_expr)
+        expr.else_expr = _fold_expr(expr.else_expr)
+        if type(expr.condition) is Literal:
+            if _is_falsey(expr.condition.value):
+                return expr.else_expr
+            return expr.then_expr
+        return expr
+    if node_type is Logical:
+        expr.left = _fold_expr(expr.left)
+        expr.right = _fold_expr(expr.right)
+        if type(expr.left) is Literal:
+            left_falsey = _is_falsey(expr.left.value)
+            if expr.operator.type == TokenType.OR:
+                return expr.right if left_falsey else expr.left
+            return expr.left if left_falsey else expr.right
+        return expr
+    if node_type is Assign:
+        expr.value = _fold_expr(expr.value)
+        return expr
+    if node_type is Call:
+        expr.callee = _fold_expr(expr.callee)
+        expr.arguments = [_fold_expr(arg) for arg in expr.arguments]
+        return expr
+    if node_type is Get:
+        expr.object = _fold_expr(expr.object)
+        return expr
+    if node_type is Set:
+        expr.object = _fold_expr(expr.object)
+        expr.value = _fold_expr(expr.value)
+        return expr
+    if node_type is Function:
+        fold_stmt_list(expr.body)
+        return expr
+    return expr
+
+
+def _fold_stmt(stmt: Stmt):
+    node_type = type(stmt)
+    if node_type is Expression or node_type is Print:
+        stmt.expression = _fold_expr(stmt.expression)
+    elif node_type is Var:
+        if stmt.initializer is not None:
+            stmt.initializer = _fold_expr(stmt.initializer)
+    elif node_type is If:
+        stmt.condition = _fold_expr(stmt.condition)
+        _fold_stmt(stmt.then_branch)
+        if stmt.else_branch is not None:
+            _fold_stmt(stmt.else_branch)
+    elif node_type is While:
+        stmt.condition = _fold_expr(stmt.condition)
+        _fold_stmt(stmt.body)
+    elif node_type is Block:
+        fold_stmt_list(stmt.statements)
+    elif node_type is FunDef:
+        fold_stmt_list(stmt.function.body)
+    elif node_type is Return:
+        if stmt.value is not None:
+            stmt.value = _fold_expr(stmt.value)
+    elif node_type is Class:
+        for method in stmt.methods + stmt.static_methods:
+            fold_stmt_list(method.function.body)
+
+
+def fold_stmt_list(statements: list[Stmt]):
+    """Fold all constant sub-expressions in the statements, in place"""
+    for statement in statements:
+        _fold_stmt(statement)
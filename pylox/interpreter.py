@@ -11,113 +11,232 @@ from .loxclass import LoxClass
 from .environment import Environment, UNINITIALIZED
 from . import errors
 from . import builtin
+from . import bytecode
+from . import fold
 from . import loxclass
 
 if TYPE_CHECKING:
     from .pylox import ErrorReporter
 
 
+# distinguishes "not defined" from any value a variable can hold
+_MISSING = object()
+
+
 class GlobalEnvironment:
-    values: dict[str, Any]
+    """
+    Globals live in a flat list; a name is hashed only until its slot
+    number is known, after which call sites cache the slot and read or
+    write with one list indexing.
+    """
+    values: list[Any]
+    name_to_slot: dict[str, int]
 
     def __init__(self):
-        self.values = {}
+        self.values = []
+        self.name_to_slot = {}
 
         for name, lox_function in builtin.FUNCTIONS.items():
             self.define(Token(None, name, None),
                         lox_function)
 
     def define(self, name: Token, value: Any = UNINITIALIZED):
-        self.values[name.lexeme] = value
+        slot = self.name_to_slot.get(name.lexeme)
+        if slot is None:
+            self.name_to_slot[name.lexeme] = len(self.values)
+            self.values.append(value)
+        else:
+            self.values[slot] = value
+
+    def slot(self, name: Token) -> int:
+        """
+        Return the slot of the variable with 'name' if it is defined.
+        Raise RuntimeError otherwise.
+        """
+        slot = self.name_to_slot.get(name.lexeme)
+        if slot is None:
+            raise errors.LoxRuntimeError(
+                    name,
+                    "Undefined variable '{}'.", name.lexeme)
+        return slot
 
     def get(self, name: Token):
         """
         Return the value of the variable with 'name' if it is defined.
         Raise RuntimeError otherwise.
         """
-        if name.lexeme in self.values:
-            if self.values[name.lexeme] is UNINITIALIZED:
-                raise errors.LoxRuntimeError(
-                        name,
-                        "Uninitialized variable '" + name.lexeme + "'.")
-            return self.values[name.lexeme]
-        raise errors.LoxRuntimeError(
-                name,
-                "Undefined variable '" + name.lexeme + "'.")
+        value = self.values[self.slot(name)]
+        if value is UNINITIALIZED:
+            raise errors.LoxRuntimeError(
+                    name,
+                    "Uninitialized variable '{}'.", name.lexeme)
+        return value
 
     def assign(self, name: Token, value: Any):
         """
         Assign a value to a variable.
         Raise RuntimeError if the variable doesn't exist.
         """
-        if name.lexeme in self.values:
-            self.values[name.lexeme] = value
-            return
+        self.values[self.slot(name)] = value
 
-        raise errors.LoxRuntimeError(
-                name,
-                "Undefined variable '" + name.lexeme + "'.")
+
+def _num_plus_str(left: float, right: str) -> str:
+    return str(left) + right
+
+
+def _str_plus_num(left: str, right: float) -> str:
+    return left + str(right)
+
+
+# (type(left), type(right)) -> handler for the '+' operator; a miss
+# means the operands are invalid for Lox addition
+_PLUS_TABLE = {
+        (float, float): lambda left, right: left + right,
+        (str, str): lambda left, right: left + right,
+        (float, str): _num_plus_str,
+        (str, float): _str_plus_num,
+        }
 
 
 class Interpreter(Expr.Visitor, Stmt.Visitor):
     error_reporter: ErrorReporter
     global_environment: GlobalEnvironment
     environment: Optional[Environment]
-    local_definitions: dict[int, Tuple[int, int]]  # Tuple[depth, index]
 
     def __init__(self, error_reporter: ErrorReporter):
         self.error_reporter = error_reporter
         self.global_environment = GlobalEnvironment()
         self.environment = None
-        self.local_definitions = {}
+        self._return_value: Any = None
+        # id(statement list) -> (statement list, chunk or None); the
+        # list is kept referenced so its id can't be recycled
+        self._script_cache: dict[int, Tuple[list[Stmt], Any]] = {}
+        # (abspath, mtime_ns, size) -> (source, statements); per
+        # interpreter because the cached nodes carry our resolver
+        # output and global-slot caches (see builtin.LoxInclude)
+        self._include_cache: dict[tuple, tuple[str, list]] = {}
+
+        # handler tables indexed by the nodes' class-level OP number:
+        # one list indexing plus one call per node instead of the
+        # accept/visit double dispatch
+        expr_types = [Binary, Call, Unary, Grouping, Literal, Ternery,
+                      Variable, Assign, Logical, Function, Get, Set,
+                      This, Super]
+        self._expr_handlers: list = [None] * len(expr_types)
+        for expr_type in expr_types:
+            self._expr_handlers[expr_type.OP] = getattr(
+                    self, "visit_" + expr_type.__name__.lower() + "_expr")
+        stmt_types = [Expression, If, Print, While, FunDef, Var, Block,
+                      Break, Return, Class]
+        self._stmt_handlers: list = [None] * len(stmt_types)
+        for stmt_type in stmt_types:
+            self._stmt_handlers[stmt_type.OP] = getattr(
+                    self, "visit_" + stmt_type.__name__.lower() + "_stmt")
+
+        # binary operator dispatch, replacing the match in
+        # visit_binary_expr
+        self._binop_table = {
+                TokenType.EQUAL_EQUAL: self.__binop_eq,
+                TokenType.BANG_EQUAL: self.__binop_neq,
+                TokenType.GREATER: self.__binop_gt,
+                TokenType.GREATER_EQUAL: self.__binop_ge,
+                TokenType.LESS: self.__binop_lt,
+                TokenType.LESS_EQUAL: self.__binop_le,
+                TokenType.PLUS: self.__binop_plus,
+                TokenType.MINUS: self.__binop_minus,
+                TokenType.STAR: self.__binop_star,
+                TokenType.SLASH: self.__binop_slash,
+                }
 
     def interpret(self, statements: list[Stmt]):
         try:
+            cached = self._script_cache.get(id(statements))
+            if cached is None:
+                fold.fold_stmt_list(statements)
+                chunk = bytecode.compile_script(statements, self)
+                self._script_cache[id(statements)] = (statements, chunk)
+            else:
+                chunk = cached[1]
+
+            if chunk is not None:
+                bytecode.run_chunk(self, chunk, self.environment)
+                return
+
             for stmt in statements:
                 self.execute(stmt)
         except errors.LoxRuntimeError as error:
             self.error_reporter.report_runtime(error.token.position,
                                                error.message)
 
-    def execute(self, stmt: Stmt):
-        stmt.accept(self)
+    def execute(self, stmt: Stmt) -> int:
+        return self._stmt_handlers[stmt.OP](stmt)
 
     def execute_block(self,
                       statements: list[Stmt],
-                      environment: Environment):
+                      environment: Environment) -> int:
         previous_environment: Optional[Environment] = self.environment
+        status = errors.NORMAL
 
+        handlers = self._stmt_handlers
         try:
             self.environment = environment
 
             for stmnt in statements:
-                self.execute(stmnt)
+                status = handlers[stmnt.OP](stmnt)
+                if status:
+                    break
         finally:
             self.environment = previous_environment
 
+        return status
+
+    def run_chunk(self, chunk: bytecode.Chunk, environment: Environment):
+        """Execute a compiled function body"""
+        return bytecode.run_chunk(self, chunk, environment)
+
     def resolve(self, node: Union[Expr, Stmt], depth: int, index: int):
-        self.local_definitions[id(node)] = (depth, index)
+        # stored directly on the node: reads skip a dict probe, and
+        # cached ASTs (includes, scripts) keep their resolution
+        node._depth = depth
+        node._slot = index
 
     def __lookup_variable(self, name: Token, expr: Expr):
-        distance, index = self.local_definitions.get(id(expr), (None, None))
-        if distance is not None \
-                and index is not None \
-                and self.environment is not None:
-            return self.environment.get_at(distance, index, name.lexeme)
-        return self.global_environment.get(name)
+        distance = expr._depth
+        if distance is not None and self.environment is not None:
+            if distance == 0:
+                # the current frame — no ancestor walk needed
+                return self.environment.values_array[expr._slot]
+            return self.environment.get_at(distance, expr._slot, name.lexeme)
+        glob = self.global_environment
+        slot = expr._g_slot
+        if slot is None:
+            slot = glob.slot(name)
+            expr._g_slot = slot
+        value = glob.values[slot]
+        if value is UNINITIALIZED:
+            raise errors.LoxRuntimeError(
+                    name,
+                    "Uninitialized variable '{}'.", name.lexeme)
+        return value
 
     def __assign_variable(self,
                           name: Token,
                           expr: Union[Expr, Stmt],
                           value: Any):
-        distance, index = self.local_definitions.get(id(expr), (None, None))
-        if distance is not None \
-                and index is not None \
-                and self.environment is not None:
+        distance = expr._depth
+        if distance is not None and self.environment is not None:
+            if distance == 0:
+                self.environment.values_array[expr._slot] = value
+                return None
             return self.environment.assign_at(
-                    distance, index, name, value
+                    distance, expr._slot, name, value
                 )
-        return self.global_environment.assign(name, value)
+        glob = self.global_environment
+        slot = expr._g_slot
+        if slot is None:
+            slot = glob.slot(name)
+            expr._g_slot = slot
+        glob.values[slot] = value
 
 
     def stringify(self, value: Any):
@@ -125,29 +244,11 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
             return "nil"
         return str(value)
 
-    def __check_number_operand(self, operator: Token, operand: object):
-        if isinstance(operand, float):
-            return
-        raise errors.LoxRuntimeError(operator, "Operand must be a number.")
-
-    def __check_number_operands(self,
-                                operator: Token,
-                                left: object,
-                                right: object):
-        if isinstance(left, float) and isinstance(right, float):
-            return
-        raise errors.LoxRuntimeError(operator, "Both operands mus be numbers.")
-
-    def __is_truthy(self, operand: object):
-        if operand is None or (isinstance(operand, bool) and not operand):
-            return False
-        return True
-
     def __is_equal(self, left: object, right: object):
         return left == right
 
     def evaluate(self, expr: Expr):
-        return expr.accept(self)
+        return self._expr_handlers[expr.OP](expr)
 
     ###########################################################################
     # Expr.Visitor
@@ -158,30 +259,64 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
         return self.evaluate(expr.expression)
 
     def visit_call_expr(self, expr: Call):
-        callee = self.evaluate(expr.callee)
-        arguments: list = []
-        for arg in expr.arguments:
-            arguments.append(self.evaluate(arg))
-
-        if not isinstance(callee, LoxCallable):
-            raise errors.LoxRuntimeError(
-                    expr.paren,
-                    "Can only call functions and classes.")
-
-        function: LoxCallable = callee
-        if len(arguments) != function.arity():
+        evaluate = self.evaluate
+        callee = evaluate(expr.callee)
+        arguments: list = [evaluate(arg) for arg in expr.arguments]
+
+        if callee is expr._cached_fn:
+            # monomorphic call site: the callable check and arity were
+            # settled on the first call
+            arity = expr._cached_arity
+        else:
+            if not isinstance(callee, LoxCallable):
+                raise errors.LoxRuntimeError(
+                        expr.paren,
+                        "Can only call functions and classes.")
+            arity = callee.arity()
+            expr._cached_fn = callee
+            expr._cached_arity = arity
+            expr._cached_call = callee.call
+
+        if len(arguments) != arity:
             raise errors.LoxRuntimeError(
                     expr.paren,
-                    "Expected " + str(function.arity())
+                    "Expected " + str(arity)
                     + " arguments, but got "
                     + str(len(arguments)) + "."
                 )
 
-        return function.call(self, arguments)
+        return expr._cached_call(self, arguments)
 
     def visit_get_expr(self, expr: Get):
         obj: Any = self.evaluate(expr.object)
+        if type(obj) is loxclass.LoxInstance:
+            # fields shadow methods, so they're always probed first
+            lexeme = expr.name.lexeme
+            value = obj.fields.get(lexeme, _MISSING)
+            if value is not _MISSING:
+                return value
+            # per-instance cache of already-bound methods
+            bound = obj.bound_methods.get(lexeme)
+            if bound is not None:
+                return bound
+            # monomorphic inline cache: method tables are immutable,
+            # so the class identity decides the lookup result
+            if obj.klass is expr._ic_class:
+                bound = expr._ic_method.bind(obj)
+                obj.bound_methods[lexeme] = bound
+                return bound
+            method = obj.klass.find_method(lexeme)
+            if method is not None:
+                expr._ic_class = obj.klass
+                expr._ic_method = method
+                bound = method.bind(obj)
+                obj.bound_methods[lexeme] = bound
+                return bound
+            raise errors.LoxRuntimeError(
+                    expr.name,
+                    "Undefined property '" + expr.name.lexeme + "'.")
         if isinstance(obj, loxclass.LoxInstance):
+            # LoxClass overrides get for static methods
             return obj.get(expr.name)
 
         raise errors.LoxRuntimeError(
@@ -190,6 +325,12 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
 
     def visit_set_expr(self, expr: Set):
         obj: Any = self.evaluate(expr.object)
+        if type(obj) is loxclass.LoxInstance:
+            value = self.evaluate(expr.value)
+            if obj.fields is loxclass.EMPTY_FIELDS:
+                obj.fields = {}
+            obj.fields[expr.name.lexeme] = value
+            return value
         if isinstance(obj, loxclass.LoxInstance):
             value = self.evaluate(expr.value)
             return obj.set(expr.name, value)
@@ -203,78 +344,114 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
 
     def visit_unary_expr(self, expr: Unary):
         right: Any = self.evaluate(expr.right)
-
-        match expr.operator.type:
-            case TokenType.MINUS:
-                self.__check_number_operand(expr.operator, right)
-                return -float(right)
-            case TokenType.BANG:
-                return not self.__is_truthy(right)
-
-        return None
+        fn = expr._fn
+        if fn is None:
+            fn = self.__unary_minus \
+                if expr.operator.type == TokenType.MINUS \
+                else self.__unary_bang
+            expr._fn = fn
+        return fn(expr, right)
+
+    def __unary_minus(self, expr: Unary, right: Any):
+        if type(right) is float:
+            return -right
+        raise errors.LoxRuntimeError(expr.operator, "Operand must be a number.")
+
+    def __unary_bang(self, expr: Unary, right: Any):
+        return right is None or right is False
 
     def visit_binary_expr(self, expr: Binary):
         left: Any = self.evaluate(expr.left)
         right: Any = self.evaluate(expr.right)
-
-        match expr.operator.type:
-            case TokenType.EQUAL_EQUAL:
-                return self.__is_equal(left, right)
-            case TokenType.BANG_EQUAL:
-                return not self.__is_equal(left, right)
-            case TokenType.GREATER:
-                self.__check_number_operands(expr.operator, left, right)
-                return left > right
-            case TokenType.GREATER_EQUAL:
-                self.__check_number_operands(expr.operator, left, right)
-                return left >= right
-            case TokenType.LESS:
-                self.__check_number_operands(expr.operator, left, right)
-                return left < right
-            case TokenType.LESS_EQUAL:
-                self.__check_number_operands(expr.operator, left, right)
-                return left <= right
-            case TokenType.PLUS:
-                if isinstance(left, str) and isinstance(right, str):
-                    return left + right
-                if isinstance(left, float) and isinstance(right, float):
-                    return left + right
-                # implicit str conversion
-                if isinstance(left, float) and isinstance(right, str):
-                    try:
-                        return str(left) + right
-                    except ValueError:
-                        raise errors.LoxRuntimeError(
-                                expr.operator,
-                                "Cannot convert '"+str(left)+"' to string.")
-                if isinstance(left, str) and isinstance(right, float):
-                    try:
-                        return left + str(right)
-                    except ValueError:
-                        raise errors.LoxRuntimeError(
-                                expr.operator,
-                                "Cannot convert '"+str(right)+"' to str.")
-                raise errors.LoxRuntimeError(
-                        expr.operator,
-                        "Both operands have to be strings or numbers."
-                    )
-            case TokenType.MINUS:
-                self.__check_number_operands(expr.operator, left, right)
-                return float(left) - float(right)
-            case TokenType.STAR:
-                self.__check_number_operands(expr.operator, left, right)
-                return float(left) * float(right)
-            case TokenType.SLASH:
-                self.__check_number_operands(expr.operator, left, right)
-                if right == 0:
-                    raise errors.LoxRuntimeError(
-                            expr.operator,
-                            "Do not divide by zero!")
-                return float(left) / float(right)
+        # inline cache: after the first execution the node remembers
+        # its handler and skips the operator-table lookup
+        fn = expr._fn
+        if fn is None:
+            fn = self._binop_table[expr.operator.type]
+            expr._fn = fn
+        return fn(expr, left, right)
+
+    def __binop_eq(self, expr: Binary, left: Any, right: Any):
+        return self.__is_equal(left, right)
+
+    def __binop_neq(self, expr: Binary, left: Any, right: Any):
+        return not self.__is_equal(left, right)
+
+    def __binop_gt(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left > right
+        raise errors.LoxRuntimeError(expr.operator,
+                                     "Both operands mus be numbers.")
+
+    def __binop_ge(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left >= right
+        raise errors.LoxRuntimeError(expr.operator,
+                                     "Both operands mus be numbers.")
+
+    def __binop_lt(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left < right
+        raise errors.LoxRuntimeError(expr.operator,
+                                     "Both operands mus be numbers.")
+
+    def __binop_le(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left <= right
+        raise errors.LoxRuntimeError(expr.operator,
+                                     "Both operands mus be numbers.")
+
+    def __binop_plus(self, expr: Binary, left: Any, right: Any):
+        handler = _PLUS_TABLE.get((type(left), type(right)))
+        if handler is None:
+            raise errors.LoxRuntimeError(
+                    expr.operator,
+                    "Both operands have to be strings or numbers."
+                )
+        # monomorphic sites get a type-specialized handler installed
+        if type(left) is float is type(right):
+            expr._fn = self.__binop_plus_ff
+        elif type(left) is str is type(right):
+            expr._fn = self.__binop_plus_ss
+        return handler(left, right)
+
+    def __binop_plus_ff(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left + right
+        expr._fn = self.__binop_plus
+        return self.__binop_plus(expr, left, right)
+
+    def __binop_plus_ss(self, expr: Binary, left: Any, right: Any):
+        if type(left) is str is type(right):
+            return left + right
+        expr._fn = self.__binop_plus
+        return self.__binop_plus(expr, left, right)
+
+    def __binop_minus(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left - right
+        raise errors.LoxRuntimeError(expr.operator,
+                                     "Both operands mus be numbers.")
+
+    def __binop_star(self, expr: Binary, left: Any, right: Any):
+        if type(left) is float is type(right):
+            return left * right
+        raise errors.LoxRuntimeError(expr.operator,
+                                     "Both operands mus be numbers.")
+
+    def __binop_slash(self, expr: Binary, left: Any, right: Any):
+        if type(left) is not float or type(right) is not float:
+            raise errors.LoxRuntimeError(expr.operator,
+                                         "Both operands mus be numbers.")
+        if right == 0:
+            raise errors.LoxRuntimeError(
+                    expr.operator,
+                    "Do not divide by zero!")
+        return left / right
 
     def visit_ternery_expr(self, expr: Ternery):
         condition = self.evaluate(expr.condition)
-        if self.__is_truthy(condition):
+        if condition is not None and condition is not False:
             return self.evaluate(expr.then_expr)
         return self.evaluate(expr.else_expr)
 
@@ -287,20 +464,31 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
         return value
 
     def visit_logical_expr(self, expr: Logical):
+        fn = expr._fn
+        if fn is None:
+            fn = self.__logical_or \
+                if expr.operator.type == TokenType.OR \
+                else self.__logical_and
+            expr._fn = fn
+        return fn(expr)
+
+    def __logical_or(self, expr: Logical):
         left = self.evaluate(expr.left)
-        if expr.operator.type == TokenType.OR:
-            if self.__is_truthy(left):
-                return left
-        else:
-            if not self.__is_truthy(left):
-                return left
+        if left is not None and left is not False:
+            return left
+        return self.evaluate(expr.right)
+
+    def __logical_and(self, expr: Logical):
+        left = self.evaluate(expr.left)
+        if left is None or left is False:
+            return left
         return self.evaluate(expr.right)
 
     def visit_this_expr(self, expr: This):
         return self.__lookup_variable(expr.keyword, expr)
     
     def visit_super_expr(self, expr: Super):
-        distance, index = self.local_definitions.get(id(expr), (None, None))
+        distance, index = expr._depth, expr._slot
         if self.environment is None or distance is None or index is None:
             # Cannot happen, since it is ensured, that 'super' is only used
             # in subclasses
@@ -318,7 +506,7 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
             superclass_index = i
         superclasses: list[LoxClass] = this.klass.superclasses
         method: Optional[LoxFunction] = \
-            superclasses[superclass_index].find_method(expr.method)
+            superclasses[superclass_index].find_method(expr.method.lexeme)
 
         if method is None:
             raise errors.LoxRuntimeError(
@@ -331,27 +519,37 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
 
     ###########################################################################
     # Stmt.Visitor
-    def visit_expression_stmt(self, stmt: Expression):
+    def visit_expression_stmt(self, stmt: Expression) -> int:
         self.evaluate(stmt.expression)
+        return errors.NORMAL
 
-    def visit_if_stmt(self, stmt: If):
+    def visit_if_stmt(self, stmt: If) -> int:
         condition = self.evaluate(stmt.condition)
-        if self.__is_truthy(condition):
-            self.execute(stmt.then_branch)
-        elif stmt.else_branch is not None:
-            self.execute(stmt.else_branch)
-
-    def visit_while_stmt(self, stmt: While):
-        try:
-            while self.__is_truthy(self.evaluate(stmt.condition)):
-                self.execute(stmt.body)
-        except errors.LoxBreak:
-            pass
-
-    def visit_print_stmt(self, stmt: Print):
+        if condition is not None and condition is not False:
+            return self.execute(stmt.then_branch)
+        if stmt.else_branch is not None:
+            return self.execute(stmt.else_branch)
+        return errors.NORMAL
+
+    def visit_while_stmt(self, stmt: While) -> int:
+        evaluate = self.evaluate
+        handlers = self._stmt_handlers
+        condition = stmt.condition
+        body = stmt.body
+        body_op = body.OP
+        while (value := evaluate(condition)) is not None and value is not False:
+            status = handlers[body_op](body)
+            if status:
+                if status == errors.BREAK:
+                    break
+                return status
+        return errors.NORMAL
+
+    def visit_print_stmt(self, stmt: Print) -> int:
         print(self.stringify(self.evaluate(stmt.expression)))
+        return errors.NORMAL
 
-    def visit_var_stmt(self, stmt: Var):
+    def visit_var_stmt(self, stmt: Var) -> int:
         value = UNINITIALIZED
         if stmt.initializer is not None:
             value = self.evaluate(stmt.initializer)
@@ -359,8 +557,9 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
             self.environment.define(stmt.name, value)
         else:
             self.global_environment.define(stmt.name, value)
+        return errors.NORMAL
 
-    def visit_fundef_stmt(self, stmt: FunDef):
+    def visit_fundef_stmt(self, stmt: FunDef) -> int:
         function: LoxFunction = LoxFunction(
                 stmt.name.lexeme,
                 stmt.function,
@@ -369,21 +568,27 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
             self.environment.define(stmt.name, function)
         else:
             self.global_environment.define(stmt.name, function)
+        return errors.NORMAL
 
-    def visit_block_stmt(self, stmt: Block):
-        self.execute_block(stmt.statements,
-                           Environment(self.environment))
+    def visit_block_stmt(self, stmt: Block) -> int:
+        if stmt._scopeless:
+            # no declarations: the resolver left this block out of the
+            # scope chain, so no environment is needed either
+            return self.execute_block(stmt.statements, self.environment)
+        return self.execute_block(stmt.statements,
+                                  Environment(self.environment))
 
-    def visit_break_stmt(self, stmt: Break):
-        raise errors.LoxBreak()
+    def visit_break_stmt(self, stmt: Break) -> int:
+        return errors.BREAK
 
-    def visit_return_stmt(self, stmt: Return):
+    def visit_return_stmt(self, stmt: Return) -> int:
         if stmt.value is None:
-            raise errors.LoxReturn(None)
-        value = self.evaluate(stmt.value)
-        raise errors.LoxReturn(value)
+            self._return_value = None
+        else:
+            self._return_value = self.evaluate(stmt.value)
+        return errors.RETURNED
 
-    def visit_class_stmt(self, klass: Class):
+    def visit_class_stmt(self, klass: Class) -> int:
         superclasses: list[LoxClass] = []
         superclasses_mapping: dict[str, int] = {}
         for pos, superclass_name in enumerate(klass.superclasses):
@@ -437,3 +642,4 @@ class Interpreter(Expr.Visitor, Stmt.Visitor):
         k = LoxClass(klass.name, superclasses, methods, static_methods)
 
         self.__assign_variable(klass.name, klass, k)
+        return errors.NORMAL
@@ -0,0 +1,240 @@
+"""
+Translate pure-numeric Lox functions into plain Python functions.
+
+A named function whose body only combines parameters, local variables
+and number literals with arithmetic, comparisons and self-recursion is
+compiled into equivalent Python source and exec'd once; later calls
+with all-float arguments run the generated function directly instead
+of the interpreter. If numba is installed the generated function is
+additionally wrapped in njit.
+
+The translator tracks which sub-expressions are booleans so Lox
+semantics survive the round trip (conditions must be comparisons,
+booleans never flow into arithmetic, truthiness of 0.0 never comes
+up). Anything outside the subset makes the translation fail and the
+function simply stays on the interpreter paths. Translated functions
+are pure, so a caller may re-run the interpreted body whenever the
+generated one raises.
+"""
+from __future__ import annotations
+import keyword
+from typing import Any, Optional, TYPE_CHECKING
+from .expr import Literal, Grouping, Binary, Unary, Ternery, Variable, \
+        Assign, Call
+from .stmt import Stmt, Expression, Var, Block, If, While, Break, Return
+from .lexer import TokenType
+
+if TYPE_CHECKING:
+    from .expr import Expr, Function
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# sentinel for LoxFunction._jitted ("not translated yet")
+UNTRIED = object()
+
+
+class _Untranslatable(Exception):
+    """Raised when a function falls outside the numeric subset"""
+    pass
+
+
+# arithmetic operators keep numbers numbers; SLASH is excluded because
+# Lox division by zero is an error while Python float division isn't
+_ARITH_OPS = {
+        TokenType.PLUS: "+",
+        TokenType.MINUS: "-",
+        TokenType.STAR: "*",
+        }
+
+_BOOL_OPS = {
+        TokenType.EQUAL_EQUAL: "==",
+        TokenType.BANG_EQUAL: "!=",
+        TokenType.LESS: "<",
+        TokenType.LESS_EQUAL: "<=",
+        TokenType.GREATER: ">",
+        TokenType.GREATER_EQUAL: ">=",
+        }
+
+
+class _Translator:
+    def __init__(self, name: str, declaration: Function):
+        self.name = name
+        self.declaration = declaration
+        # one set of declared names per open lexical scope, innermost
+        # last, so names die with their block like they do in Lox
+        self.scopes: list[set[str]] = []
+        self.recursive = False
+
+    def translate(self) -> str:
+        params = [param.lexeme for param in self.declaration.params]
+        for candidate in [self.name] + params:
+            if keyword.iskeyword(candidate):
+                raise _Untranslatable()
+        self.scopes = [set(params)]
+        if len(self.scopes[0]) != len(params):
+            raise _Untranslatable()
+        lines = ["def " + self.name + "(" + ", ".join(params) + "):"]
+        lines += self.__block(self.declaration.body, 1)
+        return "\n".join(lines) + "\n"
+
+    def __visible(self, name: str) -> bool:
+        for scope in self.scopes:
+            if name in scope:
+                return True
+        return False
+
+    def __block(self, statements: list[Stmt], indent: int) -> list[str]:
+        if not statements:
+            return ["    " * indent + "pass"]
+        lines: list[str] = []
+        for statement in statements:
+            lines += self.__stmt(statement, indent)
+        return lines
+
+    def __stmt(self, stmt: Stmt, indent: int) -> list[str]:
+        pad = "    " * indent
+        node_type = type(stmt)
+        if node_type is Return:
+            if stmt.value is None:
+                return [pad + "return None"]
+            source, is_bool = self.__expr(stmt.value)
+            if is_bool:
+                raise _Untranslatable()
+            return [pad + "return " + source]
+        if node_type is Var:
+            if stmt.initializer is None:
+                raise _Untranslatable()
+            name = stmt.name.lexeme
+            if self.__visible(name) or keyword.iskeyword(name):
+                raise _Untranslatable()
+            source, is_bool = self.__expr(stmt.initializer)
+            if is_bool:
+                raise _Untranslatable()
+            self.scopes[-1].add(name)
+            return [pad + name + " = " + source]
+        if node_type is Expression:
+            expression = stmt.expression
+            if type(expression) is Assign:
+                name = expression.name.lexeme
+                if not self.__visible(name):
+                    raise _Untranslatable()
+                source, is_bool = self.__expr(expression.value)
+                if is_bool:
+                    raise _Untranslatable()
+                return [pad + name + " = " + source]
+            source, _ = self.__expr(expression)
+            return [pad + source]
+        if node_type is Block:
+            # flattening is safe because shadowing is rejected and
+            # references to names from exited scopes don't translate
+            self.scopes.append(set())
+            try:
+                return self.__block(stmt.statements, indent)
+            finally:
+                self.scopes.pop()
+        if node_type is If:
+            lines = [pad + "if " + self.__condition(stmt.condition) + ":"]
+            lines += self.__stmt(stmt.then_branch, indent + 1)
+            if stmt.else_branch is not None:
+                lines.append(pad + "else:")
+                lines += self.__stmt(stmt.else_branch, indent + 1)
+            return lines
+        if node_type is While:
+            lines = [pad + "while " + self.__condition(stmt.condition) + ":"]
+            lines += self.__stmt(stmt.body, indent + 1)
+            return lines
+        if node_type is Break:
+            return [pad + "break"]
+        raise _Untranslatable()
+
+    def __condition(self, expr: Expr) -> str:
+        source, is_bool = self.__expr(expr)
+        if not is_bool:
+            raise _Untranslatable()
+        return source
+
+    def __expr(self, expr: Expr) -> tuple[str, bool]:
+        """Return (python source, is boolean)"""
+        node_type = type(expr)
+        if node_type is Literal:
+            if type(expr.value) is float:
+                return repr(expr.value), False
+            raise _Untranslatable()
+        if node_type is Grouping:
+            return self.__expr(expr.expression)
+        if node_type is Variable:
+            name = expr.name.lexeme
+            if self.__visible(name):
+                return name, False
+            raise _Untranslatable()
+        if node_type is Unary:
+            if expr.operator.type != TokenType.MINUS:
+                raise _Untranslatable()
+            source, is_bool = self.__expr(expr.right)
+            if is_bool:
+                raise _Untranslatable()
+            return "(-" + source + ")", False
+        if node_type is Binary:
+            left, left_bool = self.__expr(expr.left)
+            right, right_bool = self.__expr(expr.right)
+            if left_bool or right_bool:
+                raise _Untranslatable()
+            operator = _ARITH_OPS.get(expr.operator.type)
+            if operator is not None:
+                return "(" + left + " " + operator + " " + right + ")", False
+            operator = _BOOL_OPS.get(expr.operator.type)
+            if operator is not None:
+                return "(" + left + " " + operator + " " + right + ")", True
+            raise _Untranslatable()
+        if node_type is Ternery:
+            condition = self.__condition(expr.condition)
+            then_source, then_bool = self.__expr(expr.then_expr)
+            else_source, else_bool = self.__expr(expr.else_expr)
+            if then_bool or else_bool:
+                raise _Untranslatable()
+            return "(" + then_source + " if " + condition \
+                + " else " + else_source + ")", False
+        if node_type is Call:
+            # only direct self-recursion is known to stay numeric
+            callee = expr.callee
+            if type(callee) is not Variable \
+                    or callee.name.lexeme != self.name \
+                    or self.__visible(callee.name.lexeme) \
+                    or len(expr.arguments) != len(self.declaration.params):
+                raise _Untranslatable()
+            arguments = []
+            for argument in expr.arguments:
+                source, is_bool = self.__expr(argument)
+                if is_bool:
+                    raise _Untranslatable()
+                arguments.append(source)
+            self.recursive = True
+            return self.name + "(" + ", ".join(arguments) + ")", False
+        raise _Untranslatable()
+
+
+def maybe_jit(name: Optional[str], declaration: Function):
+    """
+    Try to translate a function into native Python (plus numba if
+    available). Returns (compiled function, is self-recursive) or
+    None. Recursive translations call their exec'd selves directly,
+    so the caller must make sure the Lox name still binds the same
+    function before taking the fast path.
+    """
+    if name is None:
+        return None
+    translator = _Translator(name, declaration)
+    try:
+        source = translator.translate()
+    except _Untranslatable:
+        return None
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    function = namespace[name]
+    if njit is not None:
+        function = njit(cache=False)(function)
+    return function, translator.recursive
@@ -5,10 +5,11 @@ the ErrorReporter).
 from __future__ import annotations
 from enum import Enum
 import dataclasses
-import copy
+import re
+import sys
 
 from typing import TYPE_CHECKING
-from typing import Union
+from typing import NamedTuple, Union
 
 if TYPE_CHECKING:
     from typing import Final
@@ -58,10 +59,11 @@ KEYWORD_TYPE: Final[dict[str, TokenType]] = {
 }
 
 
-@dataclasses.dataclass
-class SourcePosition:
+class SourcePosition(NamedTuple):
     """
     Represents a position in the source code
+
+    Immutable, so tokens can share it without defensive copies.
     """
     line: int = 0
     """Current line (could also be calculated, but the information will be available, so...)"""
@@ -77,7 +79,7 @@ class SourcePosition:
 LiteralType = Union[str, float, bool, None]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Token:
     """
     Represents a token.
@@ -93,6 +95,46 @@ class Token:
         return str(self.type) + " " + str(self.lexeme) + " " + str(self.literal)
 
 
+# one master pattern instead of a Python loop over single characters:
+# the whole inner scanning loop runs inside the C regex engine and
+# Python only sees one match object per token
+_TOKEN_RE = re.compile(r"""
+      (?P<WS>[ \t\r]+)
+    | (?P<NEWLINE>\n)
+    | (?P<COMMENT>//[^\n]*)
+    | (?P<NUMBER>[0-9]+(?:\.[0-9]+)?)
+    | (?P<IDENT>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<STRING>"[^"]*")
+    | (?P<UNTERMINATED>"[^"]*)
+    | (?P<OP>[!=<>]=|[(){},.;+\-*/?:!=<>])
+    | (?P<UNEXPECTED>.)
+""", re.VERBOSE)
+
+_OP_TYPE = {
+    "(": TokenType.LEFT_PAREN,
+    ")": TokenType.RIGHT_PAREN,
+    "{": TokenType.LEFT_BRACE,
+    "}": TokenType.RIGHT_BRACE,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    ";": TokenType.SEMICOLON,
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "?": TokenType.QUESTIONMARK,
+    ":": TokenType.COLON,
+    "!": TokenType.BANG,
+    "!=": TokenType.BANG_EQUAL,
+    "=": TokenType.EQUAL,
+    "==": TokenType.EQUAL_EQUAL,
+    "<": TokenType.LESS,
+    "<=": TokenType.LESS_EQUAL,
+    ">": TokenType.GREATER,
+    ">=": TokenType.GREATER_EQUAL,
+}
+
+
 class Lexer:
     """
     The Lexer with the scan method, which creates a list of tokens from the source code
@@ -109,164 +151,68 @@ class Lexer:
         """
         Scan the source and split it up into usable Tokens.
         """
-        while not self.__is_at_end():
-            self.position.start = self.position.current
-            self.__scan_token()
-
-        self.__add_token(TokenType.EOF)
-
-        return self.tokens
-    
-    def __scan_token(self):
-        c = self.__advance()
-        match c:
-            # single character tokens
-            case "(":
-                self.__add_token(TokenType.LEFT_PAREN)
-            case ")":
-                self.__add_token(TokenType.RIGHT_PAREN)
-            case "{":
-                self.__add_token(TokenType.LEFT_BRACE)
-            case "}":
-                self.__add_token(TokenType.RIGHT_BRACE)
-            case ",":
-                self.__add_token(TokenType.COMMA)
-            case ".":
-                self.__add_token(TokenType.DOT)
-            case ";":
-                self.__add_token(TokenType.SEMICOLON)
-            case "+":
-                self.__add_token(TokenType.PLUS)
-            case "-":
-                self.__add_token(TokenType.MINUS)
-            case "*":
-                self.__add_token(TokenType.STAR)
-            case "?":
-                self.__add_token(TokenType.QUESTIONMARK)
-            case ":":
-                self.__add_token(TokenType.COLON)
-
-            # whitespaces
-            case " ":
-                pass
-            case "\r":
-                pass
-            case "\t":
-                pass
-            # newline
-            case "\n":
-                self.position.line += 1
-
-            # one or two character tokens
-            case "!":
-                if self.__match("="):
-                    self.__add_token(TokenType.BANG_EQUAL)
-                else:
-                    self.__add_token(TokenType.BANG)
-            case "=":
-                if self.__match("="):
-                    self.__add_token(TokenType.EQUAL_EQUAL)
-                else:
-                    self.__add_token(TokenType.EQUAL)
-            case "<":
-                if self.__match("="):
-                    self.__add_token(TokenType.LESS_EQUAL)
+        source = self.source
+        append = self.tokens.append
+        op_type = _OP_TYPE
+        keyword_type = KEYWORD_TYPE
+        line = 1
+        # where the last scan step started; the EOF token has always
+        # carried the source from there to the end
+        last_start = 0
+
+        for match in _TOKEN_RE.finditer(source):
+            kind = match.lastgroup
+            last_start = match.start()
+            if kind == "OP":
+                lexeme = match.group()
+                append(Token(op_type[lexeme], lexeme,
+                             SourcePosition(line, match.start(),
+                                            match.end())))
+            elif kind == "IDENT":
+                lexeme = match.group()
+                typ = keyword_type.get(lexeme)
+                position = SourcePosition(line, match.start(), match.end())
+                if typ is None:
+                    # interned lexemes let dict lookups (globals,
+                    # fields) hit the pointer-equality fast path
+                    lexeme = sys.intern(lexeme)
+                    append(Token(TokenType.IDENTIFIER, lexeme, position,
+                                 lexeme))
                 else:
-                    self.__add_token(TokenType.LESS)
-            case ">":
-                if self.__match("="):
-                    self.__add_token(TokenType.GREATER_EQUAL)
-                else:
-                    self.__add_token(TokenType.GREATER)
-            
-            # "/" and comments
-            case "/":
-                if not self.__match("/"):
-                    self.__add_token(TokenType.SLASH)
-                else:
-                    while self.__peek() != '\n' and not self.__is_at_end():
-                        self.__advance()  # comments are just blasted to nowhere
-            
-            # string literals
-            case "\"":
-                while self.__peek() != "\"":
-                    if self.__is_at_end():
-                        self.error_reporter.report_lex(copy.copy(self.position), "Unfinished string at end of file.")
-                        break
-                    self.__advance()
-                if not self.__is_at_end():
-                    self.__advance()  # read ending "
-                literal = self.source[self.position.start+1:self.position.current-1]
-                self.__add_token(TokenType.STRING, literal)
-
-            case _:
-                # numbers
-                if Lexer.is_numeric(c):
-                    while Lexer.is_numeric(self.__peek()):
-                        self.__advance()
-                    if self.__peek() == "." and Lexer.is_numeric(self.__peek_next()):
-                        self.__advance()
-                        while Lexer.is_numeric(self.__peek()):
-                            self.__advance()
-                    value: float = float(self.source[self.position.start:self.position.current])
-                    self.__add_token(TokenType.NUMBER, value)
-                # identifier and keywords
-                elif Lexer.is_alpha(c):
-                    while Lexer.is_alphanumeric(self.__peek()):
-                        self.__advance()
-                    value: str = self.source[self.position.start:self.position.current]
-                    # keywords
-                    if value in KEYWORD_TYPE:
-                        self.__add_token(KEYWORD_TYPE[value])
-                    # identifier
-                    else:        
-                        self.__add_token(TokenType.IDENTIFIER, value)
-                else:
-                    self.error_reporter.report_lex(copy.copy(self.position), "Unexpected character.")
-                    self.had_error = True
-    
-    @staticmethod
-    def is_numeric(c: str) -> bool:
-        """Check if c is a numeric."""
-        return '0' <= c <= '9'
-
-    @staticmethod
-    def is_alpha(c: str) -> bool:
-        """Check if c is a character or an underscore."""
-        return 'a' <= c <= 'z' or 'A' <= c <= 'Z' or c == '_'
-    
-    @staticmethod
-    def is_alphanumeric(c: str) -> bool:
-        """Check if c is alphanumeric"""
-        return Lexer.is_alpha(c) or Lexer.is_numeric(c)
-
-    def __add_token(self, typ: TokenType, literal: LiteralType = None):
-        """Add token to the token list."""
-        lexeme = self.source[self.position.start:self.position.current]
-        self.tokens.append(Token(typ, lexeme, copy.copy(self.position), literal))
-
-    def __is_at_end(self) -> bool:
-        return self.position.current >= len(self.source)
+                    append(Token(typ, lexeme, position))
+            elif kind == "NUMBER":
+                lexeme = match.group()
+                append(Token(TokenType.NUMBER, lexeme,
+                             SourcePosition(line, match.start(), match.end()),
+                             float(lexeme)))
+            elif kind == "STRING":
+                lexeme = match.group()
+                # note: newlines inside a string don't advance 'line'
+                append(Token(TokenType.STRING, lexeme,
+                             SourcePosition(line, match.start(), match.end()),
+                             lexeme[1:-1]))
+            elif kind == "NEWLINE":
+                line += 1
+            elif kind == "WS":
+                # the old per-character loop restarted on every
+                # whitespace char, so its last start was the final one
+                last_start = match.end() - 1
+            elif kind == "COMMENT":
+                pass
+            elif kind == "UNTERMINATED":
+                position = SourcePosition(line, match.start(), match.end())
+                self.error_reporter.report_lex(
+                        position,
+                        "Unfinished string at end of file.")
+                append(Token(TokenType.STRING, match.group(), position,
+                             source[match.start()+1:match.end()-1]))
+            else:  # UNEXPECTED
+                self.error_reporter.report_lex(
+                        SourcePosition(line, match.start(), match.end()),
+                        "Unexpected character.")
+                self.had_error = True
+
+        self.position = SourcePosition(line, last_start, len(source))
+        append(Token(TokenType.EOF, source[last_start:], self.position))
 
-    def __advance(self) -> str:
-        self.position.current += 1
-        return self.source[self.position.current-1]
-    
-    def __match(self, expect: str) -> bool:
-        if self.__is_at_end():
-            return False
-        if self.source[self.position.current] != expect:
-            return False
-        
-        self.position.current += 1
-        return True
-    
-    def __peek(self) -> str:
-        if self.__is_at_end():
-            return '\0'
-        return self.source[self.position.current]
-    
-    def __peek_next(self) -> str:
-        if self.position.current + 1 >= len(self.source):
-            return '\0'
-        return self.source[self.position.current+1]
+        return self.tokens
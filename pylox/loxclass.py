@@ -8,27 +8,57 @@ if TYPE_CHECKING:
     from . import interpreter
 
 
+# shared by every instance until its first field write, so instances
+# that never store fields (method-only objects) don't each pay for an
+# empty dict; set() swaps in a real dict before the first mutation
+EMPTY_FIELDS: dict[str, Any] = {}
+
+
 class LoxInstance:
+    # instances are the one Lox object allocated in bulk, so skip the
+    # per-instance __dict__ (LoxClass below keeps one - class objects
+    # are few and carry more state)
+    __slots__ = ("klass", "fields", "bound_methods")
+
     klass: LoxClass
     fields: dict[str, Any]
+    bound_methods: dict[str, callable.LoxFunction]
 
     def __init__(self, klass: LoxClass):
         self.klass = klass
-        self.fields = {}
+        self.fields = EMPTY_FIELDS
+        # bind() allocates a fresh LoxFunction; memoize the bound
+        # wrappers so repeated method access on the same instance
+        # doesn't allocate per access (fields are probed first, so a
+        # shadowing field needs no invalidation here)
+        self.bound_methods = {}
 
     def get(self, name: lexer.Token):
-        if name.lexeme in self.fields:
+        # EAFP: one probe instead of 'in' plus index; nil-valued fields
+        # make a .get default ambiguous, KeyError isn't
+        try:
             return self.fields[name.lexeme]
+        except KeyError:
+            pass
 
-        method: Optional[callable.LoxFunction] = self.klass.find_method(name)
+        bound = self.bound_methods.get(name.lexeme)
+        if bound is not None:
+            return bound
+
+        method: Optional[callable.LoxFunction] = \
+            self.klass.find_method(name.lexeme)
         if method is not None:
-            return method.bind(self)
+            bound = method.bind(self)
+            self.bound_methods[name.lexeme] = bound
+            return bound
 
         raise errors.LoxRuntimeError(
                 name,
-                "Undefined property '" + name.lexeme + "'.")
+                "Undefined property '{}'.", name.lexeme)
 
     def set(self, name: lexer.Token, value: Any):
+        if self.fields is EMPTY_FIELDS:
+            self.fields = {}
         self.fields[name.lexeme] = value
         return value
 
@@ -43,6 +73,11 @@ class LoxClass(callable.LoxCallable, LoxInstance):
     methods: dict[str, callable.LoxFunction]
     fields: dict[str, callable.LoxFunction]  # holds the static methods
     initializer: Optional[callable.LoxFunction]
+    _arity: int
+    _super_inits: tuple[tuple[callable.LoxFunction, int, str], ...]
+    ancestor_set: frozenset[LoxClass]
+    all_methods: dict[str, callable.LoxFunction]
+    all_statics: dict[str, callable.LoxFunction]
 
     def __init__(self,
                  name: lexer.Token,
@@ -62,9 +97,49 @@ class LoxClass(callable.LoxCallable, LoxInstance):
                             lexer.SourcePosition())
                 )
         """
+        # flattened method table: every method this class can see, with
+        # the same precedence as the old recursive walk (own methods
+        # first, then earlier superclasses before later ones); built
+        # once here since method tables never change after the class
+        # statement ran
+        self.all_methods = {}
+        for superclass in reversed(superclasses):
+            self.all_methods.update(superclass.all_methods)
+        self.all_methods.update(methods)
+
+        # same flattening for static methods (a class's fields dict is
+        # immutable - LoxClass.set raises - so this can't go stale)
+        self.all_statics = {}
+        for superclass in reversed(superclasses):
+            self.all_statics.update(superclass.all_statics)
+        self.all_statics.update(static_methods)
+
         self.initializer = None
         if "init" in self.methods:
             self.initializer = self.methods["init"]
+        # the initializer never changes, so the arity doesn't either
+        self._arity = 0 if self.initializer is None \
+            else self.initializer.arity()
+        # the superclass initializers call() falls back to, with their
+        # arities and names resolved once instead of per instantiation
+        self._super_inits = tuple(
+                (superclass.initializer,
+                 superclass.initializer.arity(),
+                 superclass.name)
+                for superclass in superclasses
+                if superclass.initializer is not None)
+
+        # the class itself and all (transitive) superclasses, so
+        # subclass checks are a single set lookup instead of a walk
+        # over the superclass DAG
+        ancestors: set[LoxClass] = {self}
+        pending: list[LoxClass] = list(superclasses)
+        while pending:
+            ancestor = pending.pop()
+            if ancestor not in ancestors:
+                ancestors.add(ancestor)
+                pending.extend(ancestor.superclasses)
+        self.ancestor_set = frozenset(ancestors)
 
     def call(self,
              interpreter: interpreter.Interpreter,
@@ -74,56 +149,41 @@ class LoxClass(callable.LoxCallable, LoxInstance):
             self.initializer.bind(instance).call(interpreter,
                                                  arguments)
         else:  # try to call all superclass initializers
-            for superclass in self.superclasses:
-                if superclass.initializer is None:
-                    continue
-                if superclass.initializer.arity() != len(arguments):
+            for initializer, arity, superclass_name in self._super_inits:
+                if arity != len(arguments):
                     raise errors.LoxRuntimeError(
                             self.token,
                             "Cannot initialize because the number of "
-                            + "arguments passed to the initializer "
-                            + "doesn't fit the number of parameters of "
-                            + "the initializer of '" + superclass.name + "'. "
-                            + "Consider adding an initializer method.")
-                superclass.initializer \
-                    .bind(instance) \
-                    .call(interpreter, arguments)
+                            "arguments passed to the initializer "
+                            "doesn't fit the number of parameters of "
+                            "the initializer of '{}'. "
+                            "Consider adding an initializer method.",
+                            superclass_name)
+                initializer.bind(instance).call(interpreter, arguments)
         return instance
 
     def arity(self):
-        if self.initializer is not None:
-            return self.initializer.arity()
-        return 0
+        return self._arity
 
     def get(self, name: lexer.Token, dont_raise_error: bool = False):
         """Find static method"""
-        if name.lexeme in self.fields:
-            return self.fields[name.lexeme]
-
-        static_method: Optional[callable.LoxFunction] = None
-        for superclass in self.superclasses:
-            static_method = superclass.get(name, True)
-            if static_method is not None:
-                return static_method
+        static_method: Optional[callable.LoxFunction] = \
+            self.all_statics.get(name.lexeme)
+        if static_method is not None:
+            return static_method
 
         if dont_raise_error:
             return None
 
         raise errors.LoxRuntimeError(
                 name,
-                "Class " + self.name + " has no static method '"
-                + name.lexeme + "'.")
-
-    def find_method(self, name: lexer.Token) -> Optional[callable.LoxFunction]:
-        if name.lexeme in self.methods:
-            return self.methods[name.lexeme]
-
-        for superclass in self.superclasses:
-            method = superclass.find_method(name)
-            if method is not None:
-                return method
+                "Class {} has no static method '{}'.",
+                self.name, name.lexeme)
 
-        return None
+    def find_method(self, lexeme: str) -> Optional[callable.LoxFunction]:
+        # takes the lexeme directly so callers never have to build a
+        # throwaway Token for what is a plain string lookup
+        return self.all_methods.get(lexeme)
 
     def set(self, name: lexer.Token, value: Any):
         raise errors.LoxRuntimeError(
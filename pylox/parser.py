@@ -61,7 +61,7 @@ The grammar is defined by:
                    | IDENTIFIER
 """
 from __future__ import annotations
-from typing import Callable, TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional
 from .lexer import Token, TokenType
 from .expr import Expr, Binary, Unary, Grouping, Literal, Ternery, Variable, \
         Assign, Logical, Call, Function, Get, Set, This, Super
@@ -71,11 +71,39 @@ from .stmt import Stmt, Expression, Print, Var, Block, If, While, Break, \
 if TYPE_CHECKING:
     from .pylox import ErrorReporter
 
-BINARY_OPERATOR_TYPES = [
+# operator groups as module-level constants, so the hot productions
+# don't rebuild a collection on every call
+BINARY_OPERATOR_TYPES = frozenset((
         TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL, TokenType.GREATER,
         TokenType.GREATER_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL,
         TokenType.MINUS, TokenType.PLUS, TokenType.SLASH, TokenType.STAR
-    ]
+    ))
+
+# the same group as a bitmask over the TokenType values, so
+# __primary's misplaced-operator check is a shift and an AND
+BINARY_OPERATOR_MASK = 0
+for _operator_type in BINARY_OPERATOR_TYPES:
+    BINARY_OPERATOR_MASK |= 1 << _operator_type.value
+del _operator_type
+
+UNARY_OPERATOR_TYPES = (TokenType.BANG, TokenType.MINUS)
+
+# token types that can start a statement; __synchronize stops skipping
+# when it reaches one of these
+SYNC_TOKEN_TYPES = frozenset((
+        TokenType.CLASS, TokenType.FUN, TokenType.VAR, TokenType.FOR,
+        TokenType.IF, TokenType.WHILE, TokenType.PRINT, TokenType.RETURN
+    ))
+
+# operator precedence for the binary productions (equality <
+# comparision < term < factor); higher numbers bind tighter
+BINARY_PRECEDENCE = {
+        TokenType.EQUAL_EQUAL: 1, TokenType.BANG_EQUAL: 1,
+        TokenType.LESS: 2, TokenType.LESS_EQUAL: 2,
+        TokenType.GREATER: 2, TokenType.GREATER_EQUAL: 2,
+        TokenType.PLUS: 3, TokenType.MINUS: 3,
+        TokenType.STAR: 4, TokenType.SLASH: 4,
+    }
 
 
 class ParseError(Exception):
@@ -85,6 +113,11 @@ class ParseError(Exception):
 
 class Parser:
     """Class to parse the gramma defined above"""
+    # self.current is touched on every token; slot access beats a
+    # __dict__ probe
+    __slots__ = ("tokens", "current", "error_reporter", "nested_loops",
+                 "_primary_table", "_stmt_table")
+
     tokens: list[Token]
     current: int
     error_reporter: ErrorReporter
@@ -96,6 +129,33 @@ class Parser:
         self.error_reporter = error_reporter
         self.nested_loops = 0
 
+        # __primary dispatch, one dict probe instead of walking the
+        # alternatives in grammar order
+        self._primary_table = {
+                TokenType.FALSE: self.__primary_false,
+                TokenType.TRUE: self.__primary_true,
+                TokenType.NIL: self.__primary_nil,
+                TokenType.NUMBER: self.__primary_literal,
+                TokenType.STRING: self.__primary_literal,
+                TokenType.LEFT_PAREN: self.__primary_grouping,
+                TokenType.IDENTIFIER: self.__primary_variable,
+                TokenType.FUN: self.__primary_lambda,
+                TokenType.THIS: self.__primary_this,
+                TokenType.SUPER: self.__primary_super,
+            }
+
+        # same table treatment for __statement; the fallthrough is the
+        # expression statement
+        self._stmt_table = {
+                TokenType.IF: self.__if_statement,
+                TokenType.WHILE: self.__while_statement,
+                TokenType.FOR: self.__for_statement,
+                TokenType.PRINT: self.__print_statement,
+                TokenType.LEFT_BRACE: self.__block_statement,
+                TokenType.BREAK: self.__break_statement,
+                TokenType.RETURN: self.__return_statement,
+            }
+
     def parse(self) -> list[Stmt]:
         """
         Parse tokens and return a list of statements.
@@ -105,7 +165,8 @@ class Parser:
         statements: list[Stmt] = []
         self.nested_loops = 0
 
-        while not self.__is_at_end():
+        tokens = self.tokens
+        while tokens[self.current].type is not TokenType.EOF:
             stmt = self.__declaration()
             if stmt is not None:
                 statements.append(stmt)
@@ -121,7 +182,7 @@ class Parser:
 
     def __is_at_end(self) -> bool:
         """Return True if current token is EOF"""
-        return self.__peek().type == TokenType.EOF
+        return self.__peek().type is TokenType.EOF
 
     def __advance(self) -> Token:
         """Return current token and increment current"""
@@ -133,22 +194,22 @@ class Parser:
         """Check if current token has type 'typ'"""
         if self.__is_at_end():
             return False
-        return self.__peek().type == typ
-
-    def __check_next(self, typ: TokenType):
-        """Check if the next token has type 'typ'"""
-        if self.__is_at_end():
-            return False
-        if self.tokens[self.current+1].type == TokenType.EOF:
-            return False
-        return self.tokens[self.current+1].type == typ
+        return self.__peek().type is typ
 
-    def __match(self, types: list[TokenType]):
+    def __match(self, types: tuple[TokenType, ...]):
         """Check if current tokens type if one of types"""
-        for typ in types:
-            if self.__check(typ):
-                self.__advance()
-                return True
+        typ = self.tokens[self.current].type
+        if typ in types and typ is not TokenType.EOF:
+            self.current += 1
+            return True
+        return False
+
+    def __match_one(self, typ: TokenType):
+        """Check if current token has exactly type 'typ'"""
+        # EOF is never asked for, so no end-of-input check is needed
+        if self.tokens[self.current].type is typ:
+            self.current += 1
+            return True
         return False
 
     ###########################################################################
@@ -156,16 +217,17 @@ class Parser:
     def __declaration(self) -> Optional[Stmt]:
         try:
             # Variable declaration
-            if self.__match([TokenType.VAR]):
+            if self.__match_one(TokenType.VAR):
                 return self.__var_decl()
-            # Function declaration
-            if self.__check(TokenType.FUN) \
-                    and self.__check_next(TokenType.IDENTIFIER):
-                # since token type is already checked consume will never
-                # raise an error, so msg is irrelevant
-                self.__consume(TokenType.FUN, "")
+            # Function declaration; tokens always end in EOF, so the
+            # current+1 lookahead is safe whenever current is FUN
+            tokens = self.tokens
+            if tokens[self.current].type is TokenType.FUN \
+                    and tokens[self.current + 1].type \
+                    is TokenType.IDENTIFIER:
+                self.current += 1  # consume the FUN
                 return self.__function("function")
-            if self.__match([TokenType.CLASS]):
+            if self.__match_one(TokenType.CLASS):
                 return self.__class_decl()
             return self.__statement()
         except ParseError:
@@ -177,12 +239,12 @@ class Parser:
                                     "Expect class name.")
 
         superclasses: list[Variable] = []
-        if self.__match([TokenType.LESS]):
+        if self.__match_one(TokenType.LESS):
             self.__consume(TokenType.IDENTIFIER,
                            "Expect superclass name.")
             superclasses.append(Variable(self.__previous()))
 
-            while self.__match([TokenType.COMMA]):
+            while self.__match_one(TokenType.COMMA):
                 self.__consume(TokenType.IDENTIFIER,
                                "Expect superclass name.")
                 superclasses.append(Variable(self.__previous()))
@@ -191,9 +253,10 @@ class Parser:
                        "Expect '{' before class body.")
         methods: list[FunDef] = []
         static_methods: list[FunDef] = []
-        while not self.__check(TokenType.RIGHT_BRACE) \
-                and not self.__is_at_end():
-            if self.__match([TokenType.CLASS]):  # static (class) method
+        tokens = self.tokens
+        while (typ := tokens[self.current].type) is not TokenType.RIGHT_BRACE \
+                and typ is not TokenType.EOF:
+            if self.__match_one(TokenType.CLASS):  # static (class) method
                 static_methods.append(self.__function("static method"))
             else:
                 methods.append(self.__function("method"))
@@ -204,7 +267,7 @@ class Parser:
         var_name = self.__consume(TokenType.IDENTIFIER,
                                   "Expect variable name.")
         initializer: Optional[Expr] = None
-        if self.__match([TokenType.EQUAL]):
+        if self.__match_one(TokenType.EQUAL):
             initializer = self.__expression()
 
         self.__consume(TokenType.SEMICOLON,
@@ -237,7 +300,7 @@ class Parser:
                     TokenType.IDENTIFIER,
                     "Expect parameter name.")
                 )
-            while self.__match([TokenType.COMMA]):
+            while self.__match_one(TokenType.COMMA):
                 parameters.append(self.__consume(
                     TokenType.IDENTIFIER,
                     "Expect parameter name.")
@@ -256,29 +319,15 @@ class Parser:
         return Function(parameters, body)
 
     def __statement(self) -> Stmt:
-        if self.__match([TokenType.IF]):
-            return self.__if_statement()
-
-        if self.__match([TokenType.WHILE]):
-            return self.__while_statement()
-
-        if self.__match([TokenType.FOR]):
-            return self.__for_statement()
-
-        if self.__match([TokenType.PRINT]):
-            return self.__print_statement()
-
-        if self.__match([TokenType.LEFT_BRACE]):
-            return Block(self.__block())
-
-        if self.__match([TokenType.BREAK]):
-            return self.__break_statement()
-
-        if self.__match([TokenType.RETURN]):
-            return self.__return_statement()
-
+        handler = self._stmt_table.get(self.tokens[self.current].type)
+        if handler is not None:
+            self.current += 1
+            return handler()
         return self.__expression_statement()
 
+    def __block_statement(self) -> Stmt:
+        return Block(self.__block())
+
     def __if_statement(self) -> Stmt:
         self.__consume(TokenType.LEFT_PAREN,
                        "Expect '(' after 'if'.")
@@ -289,7 +338,7 @@ class Parser:
         then_branch: Stmt = self.__statement()
         else_branch: Optional[Stmt] = None
 
-        if self.__match([TokenType.ELSE]):
+        if self.__match_one(TokenType.ELSE):
             else_branch = self.__statement()
 
         return If(condition, then_branch, else_branch)
@@ -309,9 +358,9 @@ class Parser:
     def __for_statement(self) -> Stmt:
         self.__consume(TokenType.LEFT_PAREN, "Expect '(' after 'for'.")
         initializer: Optional[Stmt] = None
-        if self.__match([TokenType.SEMICOLON]):
+        if self.__match_one(TokenType.SEMICOLON):
             initializer = None
-        elif self.__match([TokenType.VAR]):
+        elif self.__match_one(TokenType.VAR):
             initializer = self.__var_decl()
         else:
             initializer = self.__expression_statement()
@@ -359,8 +408,9 @@ class Parser:
 
     def __block(self) -> list[Stmt]:
         statements: list[Stmt] = []
-        while not self.__check(TokenType.RIGHT_BRACE) \
-                and not self.__is_at_end():
+        tokens = self.tokens
+        while (typ := tokens[self.current].type) is not TokenType.RIGHT_BRACE \
+                and typ is not TokenType.EOF:
             stmt = self.__declaration()
             if stmt is not None:
                 statements.append(stmt)
@@ -388,28 +438,33 @@ class Parser:
 
     ###########################################################################
     # Expression productions
-    def __binary_expression(
-            self,
-            operand: Callable[[], Expr],
-            operator_types: list[TokenType]) -> Expr:
-        """Generic helper method, for all binary expression productions"""
-        expr: Expr = operand()
-
-        while self.__match(operator_types):
-            operator: Token = self.__previous()
-            right: Expr = operand()
+    def __binary(self, min_prec: int = 1) -> Expr:
+        """
+        Precedence-climbing loop covering the equality, comparision,
+        term and factor productions in one method instead of four
+        mutually recursive ones.
+        """
+        expr: Expr = self.__unary()
 
+        tokens = self.tokens
+        precedence_of = BINARY_PRECEDENCE
+        while True:
+            operator: Token = tokens[self.current]
+            precedence = precedence_of.get(operator.type)
+            if precedence is None or precedence < min_prec:
+                return expr
+            self.current += 1
+            # +1 because all binary operators are left-associative
+            right: Expr = self.__binary(precedence + 1)
             expr = Binary(expr, operator, right)
 
-        return expr
-
     def __expression(self) -> Expr:
         return self.__assignment()
 
     def __assignment(self) -> Expr:
         expr: Expr = self.__or()
 
-        if self.__match([TokenType.EQUAL]):
+        if self.__match_one(TokenType.EQUAL):
             equals: Token = self.__previous()
             value: Expr = self.__assignment()
             if isinstance(expr, Variable):
@@ -425,7 +480,7 @@ class Parser:
     def __or(self) -> Expr:
         left: Expr = self.__and()
 
-        while self.__match([TokenType.OR]):
+        while self.__match_one(TokenType.OR):
             operator: Token = self.__previous()
             right: Expr = self.__and()
 
@@ -436,7 +491,7 @@ class Parser:
     def __and(self) -> Expr:
         left: Expr = self.__ternery()
 
-        while self.__match([TokenType.AND]):
+        while self.__match_one(TokenType.AND):
             operator: Token = self.__previous()
             right: Expr = self.__ternery()
 
@@ -445,12 +500,12 @@ class Parser:
         return left
 
     def __ternery(self) -> Expr:
-        expr: Expr = self.__equality()
+        expr: Expr = self.__binary()
 
-        if self.__match([TokenType.QUESTIONMARK]):
+        if self.__match_one(TokenType.QUESTIONMARK):
             then_expr: Expr = self.__ternery()
 
-            if self.__match([TokenType.COLON]):
+            if self.__match_one(TokenType.COLON):
                 else_expr: Expr = self.__ternery()
 
             else:
@@ -463,34 +518,9 @@ class Parser:
 
         return expr
 
-    def __equality(self) -> Expr:
-        return self.__binary_expression(
-                self.__comparision,
-                [TokenType.EQUAL_EQUAL, TokenType.BANG_EQUAL])
-
-    def __comparision(self) -> Expr:
-        return self.__binary_expression(
-                self.__term,
-                [
-                    TokenType.LESS,
-                    TokenType.LESS_EQUAL,
-                    TokenType.GREATER,
-                    TokenType.GREATER_EQUAL
-                ])
-
-    def __term(self) -> Expr:
-        return self.__binary_expression(
-                self.__factor,
-                [TokenType.PLUS, TokenType.MINUS])
-
-    def __factor(self) -> Expr:
-        return self.__binary_expression(
-                self.__unary,
-                [TokenType.STAR, TokenType.SLASH])
-
     def __unary(self) -> Expr:
 
-        if self.__match([TokenType.BANG, TokenType.MINUS]):
+        if self.__match(UNARY_OPERATOR_TYPES):
             operator: Token = self.__previous()
             right: Expr = self.__unary()
             return Unary(operator, right)
@@ -500,10 +530,14 @@ class Parser:
     def __call(self) -> Expr:
         expr: Expr = self.__primary()
 
+        tokens = self.tokens
         while True:
-            if self.__match([TokenType.LEFT_PAREN]):
+            typ = tokens[self.current].type
+            if typ is TokenType.LEFT_PAREN:
+                self.current += 1
                 expr = self.__finish_call(expr)
-            elif self.__match([TokenType.DOT]):
+            elif typ is TokenType.DOT:
+                self.current += 1
                 name: Token = self.__consume(
                         TokenType.IDENTIFIER,
                         "Expect property name after '.'.")
@@ -516,10 +550,10 @@ class Parser:
         arguments: list[Expr] = []
         paren: Optional[Token] = None
 
-        if not self.__check(TokenType.RIGHT_PAREN):
+        if self.tokens[self.current].type is not TokenType.RIGHT_PAREN:
             arguments.append(self.__expression())
 
-            while self.__match([TokenType.COMMA]):
+            while self.__match_one(TokenType.COMMA):
                 arguments.append(self.__expression())
 
                 if len(arguments) > 255:
@@ -531,59 +565,67 @@ class Parser:
         return Call(callee, paren, arguments)
 
     def __primary(self) -> Expr:
-        if self.__match([TokenType.FALSE]):
-            return Literal(False)
-        if self.__match([TokenType.TRUE]):
-            return Literal(True)
+        # one token fetch, one table probe; the handler gets the
+        # already-consumed token
+        token = self.tokens[self.current]
+        handler = self._primary_table.get(token.type)
+        if handler is not None:
+            self.current += 1
+            return handler(token)
 
-        if self.__match([TokenType.NIL]):
-            return Literal(None)
+        # check for a faulty positioned binary operator
+        if BINARY_OPERATOR_MASK >> token.type.value & 1:
+            self.current += 1
+            self.error_reporter.report_parser(token.position,
+                                              "Left hand operand expected.")
+            return self.__primary()
 
-        if self.__match([TokenType.NUMBER, TokenType.STRING]):
-            return Literal(self.__previous().literal)
+        raise self.__error(token, "Expect expression.")
 
-        if self.__match([TokenType.LEFT_PAREN]):
-            expr: Expr = self.__expression()
-            self.__consume(TokenType.RIGHT_PAREN,
-                           "Expect ')' after expression.")
-            return Grouping(expr)
+    def __primary_false(self, token: Token) -> Expr:
+        return Literal(False)
 
-        if self.__match([TokenType.IDENTIFIER]):
-            return Variable(self.__previous())
+    def __primary_true(self, token: Token) -> Expr:
+        return Literal(True)
 
-        if self.__match([TokenType.FUN]):
-            return self.__function_body("function")
+    def __primary_nil(self, token: Token) -> Expr:
+        return Literal(None)
 
-        if self.__match([TokenType.THIS]):
-            return This(self.__previous())
+    def __primary_literal(self, token: Token) -> Expr:
+        return Literal(token.literal)
 
-        if self.__match([TokenType.SUPER]):
-            keyword: Token = self.__previous()
+    def __primary_grouping(self, token: Token) -> Expr:
+        expr: Expr = self.__expression()
+        self.__consume(TokenType.RIGHT_PAREN,
+                       "Expect ')' after expression.")
+        return Grouping(expr)
 
-            superclass: Optional[Token] = None
-            if self.__match([TokenType.LEFT_PAREN]):
-                self.__consume(
-                        TokenType.IDENTIFIER,
-                        "Expect superclass name.")
-                superclass = self.__previous()
-                self.__consume(
-                        TokenType.RIGHT_PAREN,
-                        "Expect ')' after superclass name.")
-
-            self.__consume(TokenType.DOT,
-                           "Expect '.' after 'super'.")
-            method: Token = self.__consume(
-                    TokenType.IDENTIFIER,
-                    "Expect method name.")
-            return Super(keyword, method, superclass)
+    def __primary_variable(self, token: Token) -> Expr:
+        return Variable(token)
 
-        # check for a faulty positioned binary operator
-        if self.__match(BINARY_OPERATOR_TYPES):
-            self.error_reporter.report_parser(self.__previous().position,
-                                              "Left hand operand expected.")
-            return self.__primary()
+    def __primary_lambda(self, token: Token) -> Expr:
+        return self.__function_body("function")
 
-        raise self.__error(self.__peek(), "Expect expression.")
+    def __primary_this(self, token: Token) -> Expr:
+        return This(token)
+
+    def __primary_super(self, token: Token) -> Expr:
+        superclass: Optional[Token] = None
+        if self.__match_one(TokenType.LEFT_PAREN):
+            self.__consume(
+                    TokenType.IDENTIFIER,
+                    "Expect superclass name.")
+            superclass = self.__previous()
+            self.__consume(
+                    TokenType.RIGHT_PAREN,
+                    "Expect ')' after superclass name.")
+
+        self.__consume(TokenType.DOT,
+                       "Expect '.' after 'super'.")
+        method: Token = self.__consume(
+                TokenType.IDENTIFIER,
+                "Expect method name.")
+        return Super(token, method, superclass)
 
     def __error(self, token: Token, message: str) -> ParseError:
         """Report error with 'message' and return ParseError object"""
@@ -598,34 +640,25 @@ class Parser:
         :return: current token (if it has the type 'typ')
         :raiseis: ParseError if type check fails
         """
-        if self.__check(typ):
-            return self.__advance()
+        token = self.tokens[self.current]
+        if token.type is typ:
+            self.current += 1
+            return token
 
-        raise self.__error(self.__peek(), message)
+        raise self.__error(token, message)
 
     def __synchronize(self):
         """Skip everything until next expression to resynchronize parser"""
         self.__advance()
 
         while not self.__is_at_end():
-            if self.__previous().type == TokenType.SEMICOLON:
+            if self.__previous().type is TokenType.SEMICOLON:
+                return
+
+            # the old match statement compared the Token object itself
+            # against TokenType members, so it never matched and the
+            # statement-starter exit was dead
+            if self.tokens[self.current].type in SYNC_TOKEN_TYPES:
                 return
 
-            match self.__peek():
-                case TokenType.CLASS:
-                    return
-                case TokenType.FUN:
-                    return
-                case TokenType.VAR:
-                    return
-                case TokenType.FOR:
-                    return
-                case TokenType.IF:
-                    return
-                case TokenType.WHILE:
-                    return
-                case TokenType.PRINT:
-                    return
-                case TokenType.RETURN:
-                    return
             self.__advance()
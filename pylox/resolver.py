@@ -117,6 +117,16 @@ class Resolver(stmt.Stmt.Visitor, expr.Expr.Visitor):
         self.current_function = enclosing_function
 
     def visit_block_stmt(self, block: stmt.Block):
+        # a block without declarations of its own can share its
+        # parent's scope; it is not counted in resolution distances,
+        # and the interpreter and compiler skip its environment based
+        # on the flag stored here
+        block._scopeless = not any(
+                type(statement) in (stmt.Var, stmt.FunDef, stmt.Class)
+                for statement in block.statements)
+        if block._scopeless:
+            self.resolve_stmt_list(block.statements)
+            return
         self.__begin_scope()
         self.resolve_stmt_list(block.statements)
         self.__end_scope()
@@ -6,13 +6,19 @@ Note: this file is generated automatically by tool/ast_generator.py
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional
 from .lexer import Token, LiteralType
 from . import expr
 
+# 'not cached yet' marker for cache slots whose cached value may
+# legitimately be None
+_UNCACHED: Any = object()
+
 
 class Stmt(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: Visitor):
         pass
@@ -59,16 +65,18 @@ class Stmt(ABC):
             pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression(Stmt):
+    OP: ClassVar[int] = 0
     expression: expr.Expr
 
     def accept(self, visitor: Stmt.Visitor):
         return visitor.visit_expression_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class If(Stmt):
+    OP: ClassVar[int] = 1
     condition: expr.Expr
     then_branch: Stmt
     else_branch: Optional[Stmt]
@@ -77,16 +85,18 @@ class If(Stmt):
         return visitor.visit_if_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Print(Stmt):
+    OP: ClassVar[int] = 2
     expression: expr.Expr
 
     def accept(self, visitor: Stmt.Visitor):
         return visitor.visit_print_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class While(Stmt):
+    OP: ClassVar[int] = 3
     condition: expr.Expr
     body: Stmt
 
@@ -94,8 +104,9 @@ class While(Stmt):
         return visitor.visit_while_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FunDef(Stmt):
+    OP: ClassVar[int] = 4
     name: Token
     function: expr.Function
 
@@ -103,8 +114,9 @@ class FunDef(Stmt):
         return visitor.visit_fundef_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Var(Stmt):
+    OP: ClassVar[int] = 5
     name: Token
     initializer: Optional[expr.Expr]
 
@@ -112,24 +124,28 @@ class Var(Stmt):
         return visitor.visit_var_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(Stmt):
+    OP: ClassVar[int] = 6
     statements: list[Stmt]
+    _scopeless: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Stmt.Visitor):
         return visitor.visit_block_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Break(Stmt):
+    OP: ClassVar[int] = 7
     keyword: Token
 
     def accept(self, visitor: Stmt.Visitor):
         return visitor.visit_break_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Return(Stmt):
+    OP: ClassVar[int] = 8
     keyword: Token
     value: Optional[expr.Expr]
 
@@ -137,12 +153,16 @@ class Return(Stmt):
         return visitor.visit_return_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Class(Stmt):
+    OP: ClassVar[int] = 9
     name: Token
     superclasses: list[Variabel]
     methods: list[FunDef]
     static_methods: list[FunDef]
+    _depth: Any = field(default=None, init=False, repr=False, compare=False)
+    _slot: Any = field(default=None, init=False, repr=False, compare=False)
+    _g_slot: Any = field(default=None, init=False, repr=False, compare=False)
 
     def accept(self, visitor: Stmt.Visitor):
         return visitor.visit_class_stmt(self)
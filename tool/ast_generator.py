@@ -27,15 +27,21 @@ Note: this file is generated automatically by tool/ast_generator.py
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional
 from .lexer import Token, LiteralType
 """
     for imp in imports:
         source += imp + "\n"
     source += """
+# 'not cached yet' marker for cache slots whose cached value may
+# legitimately be None
+_UNCACHED: Any = object()
+
 
 class """+base_class_name+"""(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: Visitor):
         pass
@@ -49,8 +55,9 @@ class """+base_class_name+"""(ABC):
         source += f"        def visit_{class_name.lower()}_{base_class_name.lower()}(self, {base_class_name.lower()}: {class_name}):\n"
         source += "            pass\n\n"
 
-    for object_definition in object_definitions:
-        source += generate_type(base_class_name, object_definition) + "\n"
+    for index, object_definition in enumerate(object_definitions):
+        source += generate_type(base_class_name, object_definition, index) \
+            + "\n"
 
         with open(
                 output_dir.rstrip("/") + "/" + base_class_name.lower() + ".py",
@@ -59,14 +66,18 @@ class """+base_class_name+"""(ABC):
             file.write(source)
     return source
 
-def generate_type(base_class_name: str, object_definition: str) -> str:
+def generate_type(base_class_name: str,
+                  object_definition: str,
+                  index: int) -> str:
     class_name: str = object_definition.split(":")[0].strip()
     members: Optional[str] = None
     if len(object_definition.split(":")) > 1:
         members = object_definition.split(":")[1].strip()
 
-    source = "\n@dataclass\n"
+    source = "\n@dataclass(slots=True)\n"
     source += f"class {class_name}({base_class_name}):\n"
+    # index into the interpreter's handler tables
+    source += f"    OP: ClassVar[int] = {index}\n"
     if members is not None:
         source += generate_members(members)
 
@@ -81,7 +92,16 @@ def generate_members(members: str):
     for member_definition in member_definitions:
         member_type = member_definition.split(" ")[0].strip().replace("~", " ")
         member_name = member_definition.split(" ")[1].strip()
-        source += f"    {member_name}: {member_type}\n"
+        if member_name.startswith("_"):
+            # internal cache slot: not part of the constructor and
+            # invisible to repr/eq; "_name=default" overrides the
+            # usual None default
+            member_name, _, default = member_name.partition("=")
+            source += f"    {member_name}: {member_type} = " \
+                    + f"field(default={default or None}, init=False, " \
+                    + "repr=False, compare=False)\n"
+        else:
+            source += f"    {member_name}: {member_type}\n"
     return source
 
 
@@ -94,20 +114,22 @@ if __name__ == "__main__":
 
     BASE_CLASS = "Expr"
     OBJECT_DEFINITIONS = [
-        "Binary: Expr left; Token operator; Expr right",
-        "Call: Expr callee; Token paren; list[Expr] arguments",
-        "Unary: Token operator; Expr right",
+        "Binary: Expr left; Token operator; Expr right; Any _fn",
+        "Call: Expr callee; Token paren; list[Expr] arguments; "
+        + "Any _cached_fn=_UNCACHED; Any _cached_arity; Any _cached_call",
+        "Unary: Token operator; Expr right; Any _fn",
         "Grouping: Expr expression",
         "Literal: LiteralType value",
         "Ternery: Expr condition; Expr then_expr; Expr else_expr",
-        "Variable: Token name",
-        "Assign: Token name; Expr value",
-        "Logical: Expr left; Token operator; Expr right",
-        "Function: list[Token] params; list[stmt.Stmt] body",
-        "Get: Expr object; Token name",
+        "Variable: Token name; Any _depth; Any _slot; Any _g_slot",
+        "Assign: Token name; Expr value; Any _depth; Any _slot; Any _g_slot",
+        "Logical: Expr left; Token operator; Expr right; Any _fn",
+        "Function: list[Token] params; list[stmt.Stmt] body; Any _chunk_cache",
+        "Get: Expr object; Token name; Any _ic_class; Any _ic_method",
         "Set: Expr object; Token name; Expr value",
-        "This: Token keyword",
-        "Super: Token keyword; Token method; Optional[Token] superclass"
+        "This: Token keyword; Any _depth; Any _slot",
+        "Super: Token keyword; Token method; Optional[Token] superclass; "
+        + "Any _depth; Any _slot"
     ]
     IMPORTS = ["from . import stmt"]
     generate_ast(BASE_CLASS, OBJECT_DEFINITIONS, OUTPUT_DIR, IMPORTS)
@@ -120,10 +142,11 @@ if __name__ == "__main__":
         "While: expr.Expr condition; Stmt body",
         "FunDef: Token name; expr.Function function",
         "Var: Token name; Optional[expr.Expr] initializer",
-        "Block: list[Stmt] statements",
+        "Block: list[Stmt] statements; Any _scopeless",
         "Break: Token keyword",
         "Return: Token keyword; Optional[expr.Expr] value",
-        "Class: Token name; list[Variabel] superclasses; list[FunDef] methods; list[FunDef] static_methods"
+        "Class: Token name; list[Variabel] superclasses; list[FunDef] methods; list[FunDef] static_methods; "
+        + "Any _depth; Any _slot; Any _g_slot"
     ]
     IMPORTS = ["from . import expr"]
     generate_ast(BASE_CLASS, OBJECT_DEFINITIONS, OUTPUT_DIR, IMPORTS)